@@ -15,6 +15,8 @@ from colorama import Fore, Style, init
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from terminal_frames import frame_writer
+
 init(autoreset=True)
 
 class VoiceModulationVisualizer:
@@ -22,18 +24,30 @@ class VoiceModulationVisualizer:
     Simple voice modulation visualizer that shows when the bot is listening
     """
     
+    # Bar fills up and back down; complete colored lines built and encoded once
+    _FRAMES = tuple(f"\r{Fore.GREEN}🎤 Listening... {'█' * i}{'░' * (10 - i)}{Style.RESET_ALL}".encode()
+                    for i in (*range(11), *range(9, 0, -1)))
+    _FRAME_INTERVAL = 0.2  # Seconds per animation frame
+    
     def __init__(self):
-        self.is_running = False
         self.visualizer_thread = None
+        # Set while stopped; the loop's frame wait returns as soon as it is set
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.terminal = os.environ.get('TERM_PROGRAM', 'Unknown')
         self.is_iterm = 'iTerm' in self.terminal
         
+    @property
+    def is_running(self):
+        """Whether the animation thread is meant to be running"""
+        return not self._stop_event.is_set()
+    
     def start(self):
         """Start the visualizer"""
         if self.is_running:
             return
         
-        self.is_running = True
+        self._stop_event.clear()
         self.visualizer_thread = threading.Thread(target=self._visualizer_loop)
         self.visualizer_thread.daemon = True
         self.visualizer_thread.start()
@@ -45,10 +59,10 @@ class VoiceModulationVisualizer:
         if not self.is_running:
             return
         
-        self.is_running = False
+        self._stop_event.set()
         
         if self.visualizer_thread and self.visualizer_thread.is_alive():
-            self.visualizer_thread.join(timeout=1)
+            self.visualizer_thread.join(timeout=0.5)
         
         # Clear the visualizer line
         print(f"\r{Fore.RESET}{' ' * 50}\r", end="", flush=True)
@@ -56,39 +70,29 @@ class VoiceModulationVisualizer:
     
     def _visualizer_loop(self):
         """Visualizer animation loop"""
-        frames = [
-            "🎤 Listening... ░░░░░░░░░░",
-            "🎤 Listening... █░░░░░░░░░",
-            "🎤 Listening... ██░░░░░░░░",
-            "🎤 Listening... ███░░░░░░░",
-            "🎤 Listening... ████░░░░░░",
-            "🎤 Listening... █████░░░░░",
-            "🎤 Listening... ██████░░░░",
-            "🎤 Listening... ███████░░░",
-            "🎤 Listening... ████████░░",
-            "🎤 Listening... █████████░",
-            "🎤 Listening... ██████████",
-            "🎤 Listening... █████████░",
-            "🎤 Listening... ████████░░",
-            "🎤 Listening... ███████░░░",
-            "🎤 Listening... ██████░░░░",
-            "🎤 Listening... █████░░░░░",
-            "🎤 Listening... ████░░░░░░",
-            "🎤 Listening... ███░░░░░░░",
-            "🎤 Listening... ██░░░░░░░░",
-            "🎤 Listening... █░░░░░░░░░",
-        ]
+        frames = self._FRAMES
+        write, flush = frame_writer()
+        next_frame = time.monotonic()
         
         frame_index = 0
         
-        while self.is_running:
+        while not self._stop_event.is_set():
             try:
                 # Print the current frame
                 frame = frames[frame_index % len(frames)]
-                print(f"\r{Fore.GREEN}{frame}{Style.RESET_ALL}", end="", flush=True)
+                write(frame)
+                flush()
                 
                 frame_index += 1
-                time.sleep(0.2)
+                
+                # Sleep to the next frame deadline so render time doesn't add drift
+                next_frame += self._FRAME_INTERVAL
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    if self._stop_event.wait(delay):
+                        return
+                else:
+                    next_frame = time.monotonic()  # Fell behind; restart the schedule
                 
             except Exception:
                 break
@@ -16,6 +16,8 @@ from colorama import Fore, Style, init
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from terminal_frames import frame_writer
+
 init(autoreset=True)
 
 class VoiceActivityDetector:
@@ -116,21 +118,40 @@ class SmartVoiceVisualizer:
     Smart voice visualizer that shows different states
     """
     
+    # Complete colored lines per state, built and encoded once
+    _FRAMES = {
+        "idle": tuple(f"\r{Fore.BLUE}💤 Waiting for speech... {'█' * i}{'░' * (10 - i)}{Style.RESET_ALL}".encode()
+                      for i in range(10)),
+        "listening": tuple(f"\r{Fore.CYAN}🎤 Listening... {'█' * i}{'░' * (10 - i)}{Style.RESET_ALL}".encode()
+                           for i in range(11)),
+        "recording": tuple(f"\r{Fore.RED}🔴 RECORDING {'█' * i}{'░' * (10 - i)}{Style.RESET_ALL}".encode()
+                           for i in range(10, 0, -1)),
+    }
+    _PROCESSING_FRAMES = (f"\r{Fore.YELLOW}⏳ Processing...{Style.RESET_ALL}".encode(),)
+    _FRAME_INTERVAL = 0.2  # Seconds per animation frame
+    
     def __init__(self):
-        self.is_running = False
         self.visualizer_thread = None
+        # Set while stopped; the loop's frame wait returns as soon as it is set
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.current_state = "idle"  # idle, listening, recording, processing
         
     def set_state(self, state):
         """Set the current state"""
         self.current_state = state
     
+    @property
+    def is_running(self):
+        """Whether the animation thread is meant to be running"""
+        return not self._stop_event.is_set()
+    
     def start(self):
         """Start the visualizer"""
         if self.is_running:
             return
         
-        self.is_running = True
+        self._stop_event.clear()
         self.visualizer_thread = threading.Thread(target=self._visualizer_loop)
         self.visualizer_thread.daemon = True
         self.visualizer_thread.start()
@@ -140,77 +161,38 @@ class SmartVoiceVisualizer:
         if not self.is_running:
             return
         
-        self.is_running = False
+        self._stop_event.set()
         
         if self.visualizer_thread and self.visualizer_thread.is_alive():
-            self.visualizer_thread.join(timeout=1)
+            self.visualizer_thread.join(timeout=0.5)
         
         # Clear the visualizer line
         print(f"\r{Fore.RESET}{' ' * 60}\r", end="", flush=True)
     
     def _visualizer_loop(self):
         """Visualizer animation loop"""
-        while self.is_running:
+        write, flush = frame_writer()
+        next_frame = time.monotonic()
+        
+        while not self._stop_event.is_set():
             try:
-                if self.current_state == "idle":
-                    frames = [
-                        "💤 Waiting for speech... ░░░░░░░░░░",
-                        "💤 Waiting for speech... █░░░░░░░░░",
-                        "💤 Waiting for speech... ██░░░░░░░░",
-                        "💤 Waiting for speech... ███░░░░░░░",
-                        "💤 Waiting for speech... ████░░░░░░",
-                        "💤 Waiting for speech... █████░░░░░",
-                        "💤 Waiting for speech... ██████░░░░",
-                        "💤 Waiting for speech... ███████░░░",
-                        "💤 Waiting for speech... ████████░░",
-                        "💤 Waiting for speech... █████████░",
-                    ]
-                elif self.current_state == "listening":
-                    frames = [
-                        "🎤 Listening... ░░░░░░░░░░",
-                        "🎤 Listening... █░░░░░░░░░",
-                        "🎤 Listening... ██░░░░░░░░",
-                        "🎤 Listening... ███░░░░░░░",
-                        "🎤 Listening... ████░░░░░░",
-                        "🎤 Listening... █████░░░░░",
-                        "🎤 Listening... ██████░░░░",
-                        "🎤 Listening... ███████░░░",
-                        "🎤 Listening... ████████░░",
-                        "🎤 Listening... █████████░",
-                        "🎤 Listening... ██████████",
-                    ]
-                elif self.current_state == "recording":
-                    frames = [
-                        "🔴 RECORDING ██████████",
-                        "🔴 RECORDING █████████░",
-                        "🔴 RECORDING ████████░░",
-                        "🔴 RECORDING ███████░░░",
-                        "🔴 RECORDING ██████░░░░",
-                        "🔴 RECORDING █████░░░░░",
-                        "🔴 RECORDING ████░░░░░░",
-                        "🔴 RECORDING ███░░░░░░░",
-                        "🔴 RECORDING ██░░░░░░░░",
-                        "🔴 RECORDING █░░░░░░░░░",
-                    ]
-                else:
-                    frames = ["⏳ Processing..."]
+                frames = self._FRAMES.get(self.current_state, self._PROCESSING_FRAMES)
                 
                 for frame in frames:
-                    if not self.is_running:
+                    if self._stop_event.is_set():
                         break
                     
-                    # Choose color based on state
-                    if self.current_state == "idle":
-                        color = Fore.BLUE
-                    elif self.current_state == "listening":
-                        color = Fore.CYAN
-                    elif self.current_state == "recording":
-                        color = Fore.RED
-                    else:
-                        color = Fore.YELLOW
+                    write(frame)
+                    flush()
                     
-                    print(f"\r{color}{frame}{Style.RESET_ALL}", end="", flush=True)
-                    time.sleep(0.2)
+                    # Sleep to the next frame deadline so render time doesn't add drift
+                    next_frame += self._FRAME_INTERVAL
+                    delay = next_frame - time.monotonic()
+                    if delay > 0:
+                        if self._stop_event.wait(delay):
+                            return
+                    else:
+                        next_frame = time.monotonic()  # Fell behind; restart the schedule
                 
             except Exception:
                 break
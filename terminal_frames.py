@@ -0,0 +1,48 @@
+"""
+Terminal Frame Output
+Writes pre-encoded animation frames straight to the terminal
+
+Standard library only, so the visualizers can import it without pulling in
+the voice_bot package and its audio/ML dependencies.
+"""
+
+import os
+import sys
+import time
+from typing import Callable, Optional, TextIO, Tuple
+
+
+def frame_writer(stream: Optional[TextIO] = None) -> Tuple[Callable[[bytes], None], Callable[[], None]]:
+    """
+    Return write/flush callables for pre-encoded frames
+
+    On a Unix terminal frames go to the file descriptor with os.write(), so
+    no text encoding or stream buffering happens per frame.
+
+    Args:
+        stream: Text stream the frames belong to (defaults to sys.stdout)
+
+    Returns:
+        Tuple of (write, flush); write takes a frame as bytes
+    """
+    stream = stream or sys.stdout
+    # Colorama converts ANSI codes on Windows and strips them when output
+    # is not a terminal, so in those cases it has to see text
+    if os.name == 'nt' or not stream.isatty():
+        return (lambda frame: stream.write(frame.decode())), stream.flush
+
+    stream.flush()  # Keep ordering with text already printed
+    fd = stream.fileno()
+
+    def write(frame: bytes):
+        view = memoryview(frame)
+        while view:
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                if len(view) == len(frame):
+                    return  # Terminal is backed up; drop this frame
+                time.sleep(0.001)  # Finish the frame we already started
+
+    # os.write() is unbuffered, so there is nothing to flush
+    return write, (lambda: None)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the CLI Fast Argument Parser
+Verifies that _fast_parse agrees with the argparse parser
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from colorama import Fore, Style, init
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import voice_bot_cli
+
+
+class TestCLIFastParse(unittest.TestCase):
+    """Test cases for _fast_parse / _build_parser"""
+
+    def test_matches_argparse(self):
+        """Known flags parse to the same values as argparse"""
+        print(f"\n{Fore.CYAN}⚡ Testing fast argument parsing{Style.RESET_ALL}")
+
+        cases = [
+            [],
+            ['--mode', 'manual', '-v'],
+            ['--mode=interactive', '--use-gpu', '--sample-rate', '8000'],
+            ['--models-dir=./models', '--tts-language', 'hi', '--chunk-size=512'],
+            ['--vosk-en-model', 'en-model', '--vosk-hi-model=hi-model', '--verbose'],
+        ]
+        parser = voice_bot_cli._build_parser()
+        for argv in cases:
+            fast = voice_bot_cli._fast_parse(argv)
+            self.assertIsNotNone(fast)
+            self.assertEqual(vars(fast), vars(parser.parse_args(argv)))
+            print(f"{Fore.GREEN}✅ {argv}{Style.RESET_ALL}")
+
+    def test_falls_back_to_argparse(self):
+        """Help, unknown flags and invalid values are left to argparse"""
+        cases = [
+            ['-h'],
+            ['--help'],
+            ['--unknown'],
+            ['--mode', 'bad'],
+            ['--sample-rate', 'fast'],
+            ['--models-dir'],
+            ['--mod', 'manual'],
+            ['--models-dir', '-h'],
+            ['--mode', 'manual', '--tts-language', '--help'],
+            ['--sample-rate', '-1'],
+        ]
+        for argv in cases:
+            self.assertIsNone(voice_bot_cli._fast_parse(argv), argv)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the CLI Input Prompts
+Verifies that colored prompts are safe to hand to readline
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from colorama import Fore, Style, init
+from unittest.mock import patch
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import voice_bot_cli
+
+
+class TestCLIPrompt(unittest.TestCase):
+    """Test cases for _input_prompt"""
+
+    def test_escapes_wrapped_for_readline(self):
+        """Escape sequences are marked zero-width when readline is loaded"""
+        print(f"\n{Fore.CYAN}⌨️  Testing readline prompt wrapping{Style.RESET_ALL}")
+
+        with patch.object(voice_bot_cli, 'readline', object()):
+            prompt = voice_bot_cli._input_prompt("\n\x1b[34mvoice-bot> \x1b[0m")
+        self.assertEqual(prompt, "\n\001\x1b[34m\002voice-bot> \001\x1b[0m\002")
+        print(f"{Fore.GREEN}✅ Prompt: {prompt!r}{Style.RESET_ALL}")
+
+    def test_prompt_unchanged_without_readline(self):
+        """Without readline the prompt is passed through as-is"""
+        with patch.object(voice_bot_cli, 'readline', None):
+            self.assertEqual(voice_bot_cli._input_prompt("\x1b[36mVoice Bot> \x1b[0m"),
+                             "\x1b[36mVoice Bot> \x1b[0m")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
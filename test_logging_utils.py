@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the Single-Line Logging Utilities
+Verifies that SingleLineHandler emits without deadlocking and that the CLI
+debug logger stays off the console handler
+"""
+
+import unittest
+import sys
+import io
+import logging
+import threading
+from pathlib import Path
+from colorama import Fore, Style, init
+from unittest.mock import patch
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_bot.logging_utils import SingleLineHandler, SingleLineFormatter
+
+
+class TestSingleLineLogging(unittest.TestCase):
+    """Test cases for SingleLineHandler"""
+
+    def test_handle_does_not_deadlock(self):
+        """handle() holds the handler lock while emit() takes it again"""
+        print(f"\n{Fore.CYAN}🔒 Testing single-line handler locking{Style.RESET_ALL}")
+
+        handler = SingleLineHandler()
+        handler.setFormatter(SingleLineFormatter('%(levelname)s: %(message)s'))
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        out = io.StringIO()
+
+        with patch('sys.stdout', out):
+            worker = threading.Thread(target=handler.handle, args=(record,), daemon=True)
+            worker.start()
+            worker.join(timeout=2)
+
+        self.assertFalse(worker.is_alive(), "SingleLineHandler deadlocked in emit()")
+        self.assertIn("INFO: hello", out.getvalue())
+        print(f"{Fore.GREEN}✅ Record emitted{Style.RESET_ALL}")
+
+    def test_cli_debug_log_does_not_propagate(self):
+        """CLI debug records are not echoed by the root console handler"""
+        import voice_bot_cli
+
+        self.assertFalse(voice_bot_cli.DEBUG_LOG.propagate)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
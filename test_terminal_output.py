@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the Terminal Frame Writer
+Verifies that frames reach the terminal whole, even on short writes
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from colorama import Fore, Style, init
+from unittest.mock import Mock, patch
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from terminal_frames import frame_writer
+
+
+def tty_stream():
+    """A stdout stand-in that claims to be a terminal"""
+    stream = Mock()
+    stream.isatty.return_value = True
+    stream.fileno.return_value = 99
+    return stream
+
+
+class TestFrameWriter(unittest.TestCase):
+    """Test cases for frame_writer"""
+
+    def test_short_writes_are_completed(self):
+        """A frame is written in full when os.write accepts it in pieces"""
+        print(f"\n{Fore.CYAN}🖥️  Testing frame writes to the terminal{Style.RESET_ALL}")
+
+        written = []
+
+        def short_write(fd, data):
+            written.append(bytes(data[:3]))
+            return min(3, len(data))
+
+        with patch('terminal_frames.os.name', 'posix'), \
+                patch('terminal_frames.os.write', side_effect=short_write):
+            write, _ = frame_writer(tty_stream())
+            write(b"\r[=====]")
+
+        self.assertEqual(b"".join(written), b"\r[=====]")
+        print(f"{Fore.GREEN}✅ Frame written in {len(written)} pieces{Style.RESET_ALL}")
+
+    def test_backed_up_terminal_drops_frame(self):
+        """A frame the terminal can't take at all is skipped"""
+        with patch('terminal_frames.os.name', 'posix'), \
+                patch('terminal_frames.os.write', side_effect=BlockingIOError) as os_write:
+            write, _ = frame_writer(tty_stream())
+            write(b"\r[=====]")
+        os_write.assert_called_once()
+
+    def test_non_terminal_gets_text(self):
+        """Redirected output goes through the text stream"""
+        stream = Mock()
+        stream.isatty.return_value = False
+        write, flush = frame_writer(stream)
+        write("\r🎤 █".encode())
+        flush()
+        stream.write.assert_called_once_with("\r🎤 █")
+        stream.flush.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the Token-Based Text Pipeline
+Verifies that the shared-token and normalized-input APIs agree with the
+string APIs, and that VoiceBot wires them up
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from colorama import Fore, Style, init
+from unittest.mock import patch
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_bot.language_detection import LanguageDetector
+from voice_bot.dialog_system import DialogManager, Intent
+
+
+class TestTextPipelineTokens(unittest.TestCase):
+    """Test cases for the token and normalized-input text APIs"""
+
+    def setUp(self):
+        self.detector = LanguageDetector()
+        self.dialog = DialogManager()
+
+    def test_detect_language_tokens_matches_string_api(self):
+        """Token detection returns the same language as string detection"""
+        print(f"\n{Fore.CYAN}🌐 Testing token-based language detection{Style.RESET_ALL}")
+
+        for text in ["Hello, how are you?", "नमस्ते आप कैसे हैं", "What can you do"]:
+            tokens = text.lower().split()
+            lang, _ = self.detector.detect_language(text)
+            token_lang, _ = self.detector.detect_language_tokens(tokens)
+            self.assertEqual(lang, token_lang)
+            print(f"{Fore.GREEN}✅ '{text}' -> {token_lang}{Style.RESET_ALL}")
+
+    def test_detect_language_tokens_empty(self):
+        """Empty token list falls back to English with zero confidence"""
+        self.assertEqual(self.detector.detect_language_tokens([]), ("en", 0.0))
+
+    def test_process_input_tokens_recognizes_intent(self):
+        """Token processing recognizes the same intent and keeps the original text"""
+        print(f"\n{Fore.CYAN}🤖 Testing token-based dialog processing{Style.RESET_ALL}")
+
+        text = "Hello There"
+        response = self.dialog.process_input_tokens(text.lower().split(), "en", text)
+
+        self.assertIn(response, self.dialog.response_generator.responses[Intent.GREETING]["en"])
+        history = self.dialog.get_conversation_history()
+        self.assertEqual(history[-1]['user_input'], text)
+        self.assertEqual(history[-1]['intent'], Intent.GREETING.value)
+        print(f"{Fore.GREEN}✅ Response: '{response}'{Style.RESET_ALL}")
+
+    def test_normalized_apis_match_string_apis(self):
+        """Normalized-input APIs agree with the string APIs"""
+        text = "  Hello There  "
+        normalized = text.lower().strip()
+        self.assertEqual(self.detector.detect_language_normalized(normalized)[0],
+                         self.detector.detect_language(text)[0])
+        self.assertEqual(self.detector.detect_language_normalized(""), ("en", 0.0))
+
+        response = self.dialog.process_input_normalized(normalized, "en", text)
+        self.assertIn(response, self.dialog.response_generator.responses[Intent.GREETING]["en"])
+        self.assertEqual(self.dialog.get_conversation_history()[-1]['user_input'], text)
+
+    def _make_bot(self, language_detector, dialog_manager):
+        """Build a VoiceBot through its real __init__ with the given components"""
+        from voice_bot.voice_bot import VoiceBot
+
+        def init_components(bot, *args):
+            bot.language_detector = language_detector
+            bot.dialog_manager = dialog_manager
+
+        with patch.object(VoiceBot, '_initialize_components', autospec=True,
+                          side_effect=init_components):
+            return VoiceBot()
+
+    def test_voice_bot_uses_normalized_api(self):
+        """VoiceBot hands the shared normalized text to the components"""
+        bot = self._make_bot(self.detector, self.dialog)
+
+        with patch.object(self.dialog, 'process_input') as process_input, \
+                patch.object(self.detector, 'detect_language') as detect_language:
+            response = bot.process_text("Hello There")
+        process_input.assert_not_called()
+        detect_language.assert_not_called()
+        self.assertIn(response, self.dialog.response_generator.responses[Intent.GREETING]["en"])
+
+    def test_process_input_delegates_to_normalized(self):
+        """Overriding process_input_normalized covers both entry points"""
+
+        class CustomDialogManager(DialogManager):
+            def process_input_normalized(self, text_lower, language="en", text=None):
+                return f"custom:{text_lower}"
+
+        dialog = CustomDialogManager()
+        bot = self._make_bot(self.detector, dialog)
+        self.assertEqual(dialog.process_input("  Hello  ", "en"), "custom:hello")
+        self.assertEqual(bot.process_text("Hello", "en"), "custom:hello")
+
+    def test_voice_bot_tracks_optimized_dialog_manager(self):
+        """OptimizedDialogManager tracks timing on both entry points"""
+        print(f"\n{Fore.CYAN}⚡ Testing optimized dialog manager wiring{Style.RESET_ALL}")
+
+        from voice_bot.dialog_optimization import OptimizedDialogManager
+
+        dialog = OptimizedDialogManager()
+        bot = self._make_bot(self.detector, dialog)
+
+        bot.process_text("Hello", "en")
+        dialog.process_input("Hello", "en")
+        self.assertEqual(dialog.get_performance_stats()["total_requests"], 2)
+        self.assertEqual(dialog.get_conversation_history()[-1]['user_input'], "Hello")
+        print(f"{Fore.GREEN}✅ Stats: {dialog.get_performance_stats()}{Style.RESET_ALL}")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
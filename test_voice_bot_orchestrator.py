@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test Cases for the VoiceBot Orchestrator Loop
+Verifies speech hand-off from the recognizer thread to the asyncio loop
+"""
+
+import unittest
+import sys
+import threading
+from pathlib import Path
+from colorama import Fore, Style, init
+from unittest.mock import Mock, patch
+
+init(autoreset=True)
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_bot.voice_bot import VoiceBot
+from voice_bot.language_detection import LanguageDetector
+from voice_bot.dialog_system import DialogManager
+
+
+def make_bot():
+    """Create a VoiceBot with lightweight components and no audio models"""
+    def init_components(bot, *args):
+        bot.language_detector = LanguageDetector()
+        bot.dialog_manager = DialogManager()
+        bot.tts_synthesizer = Mock()
+        bot.continuous_recognizer = Mock()
+
+    with patch.object(VoiceBot, '_initialize_components', autospec=True,
+                      side_effect=init_components):
+        return VoiceBot()
+
+
+class TestVoiceBotOrchestrator(unittest.TestCase):
+    """Test cases for the asyncio-based orchestrator"""
+
+    def setUp(self):
+        patcher = patch('voice_bot.voice_bot.voice_bot_spinner')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_speech_is_processed_on_loop_thread(self):
+        """Recognizer callbacks are queued onto the orchestrator loop"""
+        print(f"\n{Fore.CYAN}🔁 Testing speech hand-off to orchestrator loop{Style.RESET_ALL}")
+
+        bot = make_bot()
+        responses = []
+        done = threading.Event()
+
+        def on_response(response):
+            responses.append((response, threading.current_thread().name))
+            done.set()
+
+        bot.on_response_generated = on_response
+        bot.start()
+        try:
+            self.assertTrue(bot.is_running)
+            bot._on_speech_recognized("hello there")
+            self.assertTrue(done.wait(timeout=5))
+        finally:
+            bot.stop()
+
+        self.assertEqual(responses[0][1], "voice-bot-loop")
+        self.assertFalse(bot._loop_thread.is_alive())
+        print(f"{Fore.GREEN}✅ Response: '{responses[0][0]}'{Style.RESET_ALL}")
+
+    def test_speech_ignored_when_not_running(self):
+        """Speech arriving without a running loop is dropped, not raised"""
+        bot = make_bot()
+        bot._on_speech_recognized("hello")
+        bot.tts_synthesizer.speak.assert_not_called()
+
+    def test_start_failure_raises_voice_bot_error(self):
+        """Errors while starting the loop surface as VoiceBotError"""
+        from voice_bot.voice_bot import VoiceBotError
+
+        bot = make_bot()
+        bot.continuous_recognizer.start_listening.side_effect = RuntimeError("no mic")
+        with self.assertRaises(VoiceBotError):
+            bot.start()
+        self.assertFalse(bot.is_running)
+
+    def test_recognition_paused_while_speaking(self):
+        """The recognizer is paused around TTS and resumed afterwards"""
+        bot = make_bot()
+        recognizer = bot.continuous_recognizer
+        bot.tts_synthesizer.speak.side_effect = lambda *args: recognizer.pause.assert_called_once()
+        bot.speak("hello")
+        recognizer.resume.assert_called_once()
+        self.assertEqual(bot._speaking, 0)
+
+    def test_speech_dropped_while_speaking(self):
+        """Utterances recognized while the bot talks are not queued as input"""
+        print(f"\n{Fore.CYAN}🔇 Testing self-speech suppression{Style.RESET_ALL}")
+
+        bot = make_bot()
+        heard = []
+        done = threading.Event()
+
+        def speak_and_hear(*args):
+            # The recognizer picks up the bot's own voice mid-sentence
+            bot._on_speech_recognized("i heard myself")
+
+        def on_speech(text):
+            heard.append(text)
+            done.set()
+
+        bot.tts_synthesizer.speak.side_effect = speak_and_hear
+        bot.on_speech_detected = on_speech
+        bot.start()
+        try:
+            bot.speak("hello there")
+            bot._on_speech_recognized("real user input")
+            self.assertTrue(done.wait(timeout=5))
+        finally:
+            bot.stop()
+
+        self.assertEqual(heard[0], "real user input")
+        self.assertNotIn("i heard myself", heard)
+        print(f"{Fore.GREEN}✅ Heard: {heard}{Style.RESET_ALL}")
+
+    def test_speak_async_outside_loop_uses_thread(self):
+        """Legacy callers outside the loop still get the TTS thread"""
+        bot = make_bot()
+        thread = Mock()
+        bot.tts_synthesizer.speak_async.return_value = thread
+        self.assertIs(bot.speak_async("hi"), thread)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
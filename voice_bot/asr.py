@@ -9,6 +9,7 @@ import pyaudio
 import numpy as np
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 import logging
@@ -191,19 +192,25 @@ class SpeechRecognizer:
         self.recognizers = {}
         
         # Initialize Vosk recognizers if models are provided
-        if vosk_en_model_path and Path(vosk_en_model_path).exists():
-            try:
-                self.recognizers['vosk_en'] = VoskRecognizer(vosk_en_model_path)
-                logging.info("English Vosk recognizer initialized")
-            except Exception as e:
-                logging.warning(f"Failed to initialize English Vosk: {e}")
+        models = [
+            ('vosk_en', "English", vosk_en_model_path),
+            ('vosk_hi', "Hindi", vosk_hi_model_path),
+        ]
+        models = [(key, name, path) for key, name, path in models
+                  if path and Path(path).exists()]
         
-        if vosk_hi_model_path and Path(vosk_hi_model_path).exists():
-            try:
-                self.recognizers['vosk_hi'] = VoskRecognizer(vosk_hi_model_path)
-                logging.info("Hindi Vosk recognizer initialized")
-            except Exception as e:
-                logging.warning(f"Failed to initialize Hindi Vosk: {e}")
+        if models:
+            # Load the models side by side; Vosk releases the GIL while loading
+            with ThreadPoolExecutor(max_workers=len(models)) as pool:
+                loads = [(key, name, pool.submit(VoskRecognizer, path))
+                         for key, name, path in models]
+            
+            for key, name, load in loads:
+                try:
+                    self.recognizers[key] = load.result()
+                    logging.info(f"{name} Vosk recognizer initialized")
+                except Exception as e:
+                    logging.warning(f"Failed to initialize {name} Vosk: {e}")
         
         # Note: Whisper support has been removed - using Vosk only
         
@@ -296,6 +303,7 @@ class ContinuousSpeechRecognizer:
         self.audio_processor = AudioProcessor(sample_rate)
         
         self.is_listening = False
+        self.is_paused = False  # Audio is read but discarded (e.g. while the bot speaks)
         self.audio_buffer = []
         self.last_speech_time = 0
         
@@ -333,6 +341,17 @@ class ContinuousSpeechRecognizer:
         
         logging.info("Stopped continuous speech recognition")
     
+    def pause(self):
+        """Discard incoming audio until resume() (the stream keeps draining)"""
+        self.is_paused = True
+        logging.debug("Continuous recognition paused")
+    
+    def resume(self):
+        """Resume recognizing incoming audio"""
+        self.last_speech_time = time.time()
+        self.is_paused = False
+        logging.debug("Continuous recognition resumed")
+    
     def _recording_loop(self):
         """Main recording loop"""
         try:
@@ -348,6 +367,11 @@ class ContinuousSpeechRecognizer:
                     if audio_chunk is None:
                         continue
                     
+                    if self.is_paused:
+                        # Drop anything buffered so it isn't recognized later
+                        self.audio_buffer = []
+                        continue
+                    
                     chunk_count += 1
                     if chunk_count % 100 == 0:  # Log every 100 chunks
                         logging.debug(f"Received {chunk_count} audio chunks")
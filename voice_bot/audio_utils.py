@@ -9,7 +9,7 @@ import threading
 import queue
 import time
 import os
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import logging
 
 # Setup debug logging for audio troubleshooting
@@ -497,6 +497,19 @@ class AudioTranscriber:
             audio_data: Raw audio data
             sample_rate: Audio sample rate
             
+        Returns:
+            Transcribed text
+        """
+        return self.transcribe_chunks((audio_data,), sample_rate)
+    
+    def transcribe_chunks(self, chunks: Sequence[bytes], sample_rate: int = 16000) -> str:
+        """
+        Transcribe recorded audio chunks without joining them first
+        
+        Args:
+            chunks: Raw audio chunks in recording order (read once per model)
+            sample_rate: Audio sample rate
+            
         Returns:
             Transcribed text
         """
@@ -506,7 +519,6 @@ class AudioTranscriber:
                 return "Transcription unavailable - models not loaded"
             
             import vosk
-            import json
             import sys
             from io import StringIO
             
@@ -517,45 +529,19 @@ class AudioTranscriber:
             transcripts = {}
             
             try:
-                # Try English model if available
-                if self.en_model:
+                for language, model in (('English', self.en_model), ('Hindi', self.hi_model)):
+                    if not model:
+                        continue
                     try:
-                        debug_log("Trying English model for transcription", "DEBUG")
-                        recognizer = vosk.KaldiRecognizer(self.en_model, sample_rate)
+                        debug_log(f"Trying {language} model for transcription", "DEBUG")
+                        text = self._recognize_chunks(vosk.KaldiRecognizer(model, sample_rate), chunks)
                         
-                        if recognizer.AcceptWaveform(audio_data):
-                            result = json.loads(recognizer.Result())
-                            en_transcript = result.get('text', '').strip()
-                        else:
-                            result = json.loads(recognizer.PartialResult())
-                            en_transcript = result.get('partial', '').strip()
-                        
-                        if en_transcript:
-                            transcripts['English'] = en_transcript
-                            debug_log(f"English transcription: '{en_transcript}'", "DEBUG")
-                            
-                    except Exception as e:
-                        debug_log(f"English model failed: {e}", "WARNING")
-                
-                # Try Hindi model if available
-                if self.hi_model:
-                    try:
-                        debug_log("Trying Hindi model for transcription", "DEBUG")
-                        recognizer = vosk.KaldiRecognizer(self.hi_model, sample_rate)
-                        
-                        if recognizer.AcceptWaveform(audio_data):
-                            result = json.loads(recognizer.Result())
-                            hi_transcript = result.get('text', '').strip()
-                        else:
-                            result = json.loads(recognizer.PartialResult())
-                            hi_transcript = result.get('partial', '').strip()
-                        
-                        if hi_transcript:
-                            transcripts['Hindi'] = hi_transcript
-                            debug_log(f"Hindi transcription: '{hi_transcript}'", "DEBUG")
+                        if text:
+                            transcripts[language] = text
+                            debug_log(f"{language} transcription: '{text}'", "DEBUG")
                             
                     except Exception as e:
-                        debug_log(f"Hindi model failed: {e}", "WARNING")
+                        debug_log(f"{language} model failed: {e}", "WARNING")
                 
             finally:
                 # Restore stderr
@@ -588,6 +574,19 @@ class AudioTranscriber:
             debug_log(f"Transcription error: {e}", "ERROR")
             return f"Transcription error: {str(e)}"
     
+    @staticmethod
+    def _recognize_chunks(recognizer, chunks: Sequence[bytes]) -> str:
+        """Feed chunks to a Vosk recognizer and join its utterance results"""
+        import json
+        
+        parts = []
+        for chunk in chunks:
+            # True at each utterance boundary; Result() then resets the recognizer
+            if recognizer.AcceptWaveform(chunk):
+                parts.append(json.loads(recognizer.Result()).get('text', '').strip())
+        parts.append(json.loads(recognizer.FinalResult()).get('text', '').strip())
+        return ' '.join(part for part in parts if part)
+    
     def transcribe_audio_file(self, audio_file_path: str, sample_rate: int = 16000) -> str:
         """
         Transcribe audio from file
@@ -49,8 +49,12 @@ class OptimizedIntentRecognizer(IntentRecognizer):
         """
         Optimized intent recognition with caching
         """
-        text_lower = text.lower().strip()
-        
+        return self.recognize_intent_normalized(text.lower().strip())
+    
+    def recognize_intent_normalized(self, text_lower: str) -> IntentMatch:
+        """
+        Optimized intent recognition for already normalized input
+        """
         # Check cache first
         with self._cache_lock:
             if text_lower in self._intent_cache:
@@ -228,21 +232,24 @@ class OptimizedDialogManager(DialogManager):
         self._batch_lock = threading.Lock()
         self._batch_size = 5
     
-    def process_input(self, text: str, language: str = "en") -> str:
+    def process_input_normalized(self, text_lower: str, language: str = "en",
+                                 text: Optional[str] = None) -> str:
         """
         Optimized input processing with performance tracking
+        
+        process_input() normalizes the text and delegates here.
         """
         start_time = time.time()
         
         try:
-            # Recognize intent
-            intent_match = self.intent_recognizer.recognize_intent(text)
+            # Recognize intent (cached, no re-normalization)
+            intent_match = self.intent_recognizer.recognize_intent_normalized(text_lower)
             
             # Generate response
             response = self.response_generator.generate_response(intent_match, language)
             
             # Store in conversation history
-            self._add_to_history(text, response, intent_match.intent.value)
+            self._add_to_history(text if text is not None else text_lower, response, intent_match.intent.value)
             
             # Track processing time
             processing_time = time.time() - start_time
@@ -137,8 +137,18 @@ class IntentRecognizer:
         Returns:
             IntentMatch object with recognized intent
         """
-        text_lower = text.lower().strip()
+        return self.recognize_intent_normalized(text.lower().strip())
+    
+    def recognize_intent_normalized(self, text_lower: str) -> IntentMatch:
+        """
+        Recognize intent from input that is already lowercased and stripped
         
+        Args:
+            text_lower: Normalized user input text
+            
+        Returns:
+            IntentMatch object with recognized intent
+        """
         # Check each intent pattern
         for intent, patterns in self.patterns.items():
             for pattern in patterns:
@@ -393,17 +403,47 @@ class DialogManager:
         Returns:
             Generated response
         """
-        # Recognize intent
-        intent_match = self.intent_recognizer.recognize_intent(text)
+        return self.process_input_normalized(text.lower().strip(), language, text)
+    
+    def process_input_normalized(self, text_lower: str, language: str = "en",
+                                 text: Optional[str] = None) -> str:
+        """
+        Process user input that is already lowercased and stripped
+        
+        Args:
+            text_lower: Normalized user input (``text.lower().strip()``)
+            language: Detected language
+            text: Original input, stored in history when given
+            
+        Returns:
+            Generated response
+        """
+        # Recognize intent without re-normalizing the input
+        intent_match = self.intent_recognizer.recognize_intent_normalized(text_lower)
         
         # Generate response
         response = self.response_generator.generate_response(intent_match, language)
         
         # Store in conversation history
-        self._add_to_history(text, response, intent_match.intent.value)
+        self._add_to_history(text if text is not None else text_lower, response, intent_match.intent.value)
         
         return response
     
+    def process_input_tokens(self, tokens: List[str], language: str = "en",
+                             text: Optional[str] = None) -> str:
+        """
+        Process pre-tokenized user input and generate response
+        
+        Args:
+            tokens: Lowercased tokens of the user input (``text.lower().split()``)
+            language: Detected language
+            text: Original input, stored in history when given
+            
+        Returns:
+            Generated response
+        """
+        return self.process_input_normalized(" ".join(tokens), language, text)
+    
     def _add_to_history(self, user_input: str, bot_response: str, intent: str):
         """Add exchange to conversation history"""
         exchange = {
@@ -93,8 +93,41 @@ class LanguageDetector:
         if not text or not text.strip():
             return "en", 0.0
         
-        text = text.strip()
+        return self._detect(text.strip())
+    
+    def detect_language_normalized(self, text_lower: str) -> Tuple[str, float]:
+        """
+        Detect language of input that is already lowercased and stripped
+        
+        Lets callers that normalize once (``text.lower().strip()``) share the
+        same string with the dialog system instead of re-normalizing the
+        utterance for every component.
+        
+        Args:
+            text_lower: Normalized input text
+            
+        Returns:
+            Tuple of (language_code, confidence)
+        """
+        if not text_lower:
+            return "en", 0.0
         
+        return self._detect(text_lower, lowered=True)
+    
+    def detect_language_tokens(self, tokens: List[str]) -> Tuple[str, float]:
+        """
+        Detect language of already lowercased, whitespace-split text
+        
+        Args:
+            tokens: Lowercased tokens of the input text
+            
+        Returns:
+            Tuple of (language_code, confidence)
+        """
+        return self.detect_language_normalized(" ".join(tokens))
+    
+    def _detect(self, text: str, lowered: bool = False) -> Tuple[str, float]:
+        """Run langdetect with pattern-based fallback on normalized text"""
         # Try langdetect first if available
         if detect:
             try:
@@ -108,14 +141,14 @@ class LanguageDetector:
                     return "en", confidence
                 else:
                     # Fallback to pattern-based detection
-                    return self._pattern_based_detection(text)
+                    return self._pattern_based_detection(text, lowered)
                     
             except LangDetectException:
                 # Fallback to pattern-based detection
-                return self._pattern_based_detection(text)
+                return self._pattern_based_detection(text, lowered)
         else:
             # Use pattern-based detection
-            return self._pattern_based_detection(text)
+            return self._pattern_based_detection(text, lowered)
     
     def _get_langdetect_confidence(self, text: str) -> float:
         """Get confidence from langdetect"""
@@ -131,12 +164,13 @@ class LanguageDetector:
         
         return 0.5
     
-    def _pattern_based_detection(self, text: str) -> Tuple[str, float]:
+    def _pattern_based_detection(self, text: str, lowered: bool = False) -> Tuple[str, float]:
         """
         Pattern-based language detection using character analysis
         
         Args:
             text: Input text
+            lowered: Whether text is already lowercased
             
         Returns:
             Tuple of (language_code, confidence)
@@ -152,7 +186,7 @@ class LanguageDetector:
                 english_chars += 1
         
         # Count words by language
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = re.findall(r'\b\w+\b', text if lowered else text.lower())
         hindi_word_count = sum(1 for word in words if word in self.hindi_words)
         english_word_count = sum(1 for word in words if word in self.english_words)
         
@@ -4,7 +4,6 @@ Logging utilities for single-line output
 
 import sys
 import logging
-import threading
 from typing import Optional
 
 class SingleLineFormatter(logging.Formatter):
@@ -32,7 +31,6 @@ class SingleLineHandler(logging.Handler):
     
     def __init__(self):
         super().__init__()
-        self.lock = threading.Lock()
         self.current_line_length = 0
         
     def emit(self, record):
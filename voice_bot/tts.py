@@ -4,6 +4,7 @@ Handles text-to-speech conversion using Coqui TTS
 """
 
 import os
+import subprocess
 import numpy as np
 import threading
 import time
@@ -31,6 +32,33 @@ class TTSError(Exception):
     pass
 
 
+def system_say(text: str):
+    """
+    Speak text with the system 'say' command, blocking until it finishes
+    
+    The CLI blocks SIGINT/SIGTERM for sigwait-based shutdown and children
+    inherit that mask, so the child is spawned with an empty signal mask.
+    posix_spawn does that without running Python code between fork and exec,
+    which isn't safe with other threads running.
+    
+    Args:
+        text: Text to speak
+        
+    Raises:
+        subprocess.CalledProcessError: If 'say' exits with a non-zero status
+    """
+    if not hasattr(os, 'posix_spawnp'):
+        subprocess.run(["say", text], check=True)
+        return
+    
+    pid = os.posix_spawnp("say", ["say", text], os.environ, setsigmask=())
+    _, status = os.waitpid(pid, 0)
+    # os.waitstatus_to_exitcode needs Python 3.9
+    returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, ["say", text])
+
+
 class PyTTSX3TTS:
     """Fallback TTS implementation using pyttsx3"""
     
@@ -3,14 +3,15 @@ Main Voice Bot Class
 Orchestrates all components for complete voice interaction
 """
 
+import asyncio
+import contextlib
 import logging
 import threading
-import time
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
 
 from .asr import SpeechRecognizer, ContinuousSpeechRecognizer
-from .tts import TTSSynthesizer
+from .tts import TTSSynthesizer, system_say
 from .language_detection import LanguageDetector
 from .dialog_system import DialogManager
 from .spinner import voice_bot_spinner
@@ -63,6 +64,18 @@ class VoiceBot:
         self.is_listening = False
         self.current_language = tts_language
         
+        # Orchestrator event loop (runs on a background thread, see start())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._speech_queue: Optional[asyncio.Queue] = None
+        self._stop_requested: Optional[asyncio.Event] = None
+        self._start_error: Optional[Exception] = None
+        self._tasks = set()
+        
+        # Recognition is paused while the bot talks so it doesn't hear itself
+        self._speaking = 0
+        self._speaking_lock = threading.Lock()
+        
         # Callbacks
         self.on_speech_detected: Optional[Callable[[str], None]] = None
         self.on_response_generated: Optional[Callable[[str], None]] = None
@@ -214,7 +227,7 @@ class VoiceBot:
                 )
                 
                 # Set up callbacks
-                self.continuous_recognizer.on_speech_detected = self._handle_speech_detected
+                self.continuous_recognizer.on_speech_detected = self._on_speech_recognized
                 self.continuous_recognizer.on_error = self._handle_recognition_error
                 
                 logging.info("Continuous recognition initialized")
@@ -224,11 +237,32 @@ class VoiceBot:
             raise
     
     def start(self):
-        """Start the voice bot"""
+        """
+        Start the voice bot
+        
+        Synchronous facade: the orchestrator runs as ``asyncio.run(self._run())``
+        on a background thread, so callers keep a non-blocking start()/stop().
+        """
         if self.is_running:
             logging.warning("Voice bot is already running")
             return
         
+        ready = threading.Event()
+        self._start_error = None
+        self._loop_thread = threading.Thread(target=asyncio.run, args=(self._run(ready),),
+                                             name="voice-bot-loop", daemon=True)
+        self._loop_thread.start()
+        ready.wait()
+        
+        if self._start_error:
+            raise VoiceBotError(f"Failed to start: {self._start_error}")
+    
+    async def _run(self, ready: threading.Event):
+        """Orchestrator loop: owns speech dispatch, TTS tasks and spinner resets"""
+        self._loop = asyncio.get_running_loop()
+        self._speech_queue = asyncio.Queue()
+        self._stop_requested = asyncio.Event()
+        
         try:
             self.is_running = True
             logging.info("Voice Bot started")
@@ -243,17 +277,30 @@ class VoiceBot:
                 # Startup announcement
                 startup_message = "Hey, We ready to rumble! Let us go"
                 logging.info(f"Startup announcement: {startup_message}")
-                try:
-                    self.speak(startup_message, blocking=False)
-                except Exception as e:
-                    logging.warning(f"Failed to speak startup message: {e}")
+                self.speak_async(startup_message)
             
         except Exception as e:
             self.is_running = False
+            self._loop = None
             logging.error(f"Failed to start voice bot: {e}")
             if self.on_error:
                 self.on_error(e)
-            raise VoiceBotError(f"Failed to start: {e}")
+            self._start_error = e
+            ready.set()
+            return
+        
+        ready.set()
+        worker = asyncio.create_task(self._speech_worker())
+        
+        await self._stop_requested.wait()
+        
+        # Cancel speech handling and drop TTS tasks that haven't started;
+        # speech already playing runs to completion on its executor thread
+        worker.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(worker, *self._tasks, return_exceptions=True)
+        self._loop = None
     
     def stop(self):
         """Stop the voice bot"""
@@ -271,6 +318,13 @@ class VoiceBot:
                 voice_bot_spinner.stop()
                 logging.info("Stopped listening for speech")
             
+            # Stop the orchestrator loop
+            loop = self._loop
+            if loop and not loop.is_closed():
+                loop.call_soon_threadsafe(self._stop_requested.set)
+            if self._loop_thread and self._loop_thread is not threading.current_thread():
+                self._loop_thread.join(timeout=1.0)
+            
             logging.info("Voice Bot stopped")
             
         except Exception as e:
@@ -278,7 +332,25 @@ class VoiceBot:
             if self.on_error:
                 self.on_error(e)
     
-    def _handle_speech_detected(self, text: str):
+    def _on_speech_recognized(self, text: str):
+        """Hand speech from the recognizer thread over to the orchestrator loop"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            logging.warning(f"Speech received while voice bot is not running: {text}")
+            return
+        if self._speaking:
+            # Recognized just as TTS started: most likely the bot's own voice
+            logging.debug(f"Dropping speech recognized while speaking: {text}")
+            return
+        loop.call_soon_threadsafe(self._speech_queue.put_nowait, text)
+    
+    async def _speech_worker(self):
+        """Process queued utterances one at a time"""
+        while True:
+            text = await self._speech_queue.get()
+            await self._handle_speech_detected(text)
+    
+    async def _handle_speech_detected(self, text: str):
         """Handle detected speech"""
         try:
             logging.info(f"Speech detected: {text}")
@@ -288,9 +360,12 @@ class VoiceBot:
             if self.on_speech_detected:
                 self.on_speech_detected(text)
             
+            # Normalize once and share the result with detection and dialog
+            normalized = text.lower().strip()
+            
             # Detect language with error handling
             try:
-                detected_language, confidence = self.language_detector.detect_language(text)
+                detected_language, confidence = self.language_detector.detect_language_normalized(normalized)
                 logging.info(f"Language detected: {detected_language} (confidence: {confidence:.2f})")
                 
                 # Call language detection callback
@@ -303,7 +378,7 @@ class VoiceBot:
             # Process input through dialog system with error handling
             try:
                 voice_bot_spinner.update_status("Generating response")
-                response = self.dialog_manager.process_input(text, detected_language)
+                response = self.dialog_manager.process_input_normalized(normalized, detected_language, text)
                 logging.info(f"Generated response: {response}")
             except Exception as e:
                 logging.error(f"Dialog processing failed: {e}")
@@ -312,7 +387,8 @@ class VoiceBot:
             # Speak response with error handling
             try:
                 voice_bot_spinner.start_speaking()
-                self.speak(response, detected_language)
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.speak, response, detected_language)
                 voice_bot_spinner.stop()
                 voice_bot_spinner.start_listening()  # Resume listening
             except Exception as e:
@@ -322,13 +398,14 @@ class VoiceBot:
                 try:
                     fallback_lang = "en" if detected_language == "hi" else "hi"
                     voice_bot_spinner.start_speaking()
-                    self.speak(response, fallback_lang)
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.speak, response, fallback_lang)
                     voice_bot_spinner.stop()
                     voice_bot_spinner.start_listening()  # Resume listening
                 except Exception as fallback_error:
                     logging.error(f"Fallback TTS also failed: {fallback_error}")
                     voice_bot_spinner.show_error("Speech synthesis failed")
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                     voice_bot_spinner.stop()
                     voice_bot_spinner.start_listening()  # Resume listening
                     if self.on_error:
@@ -341,7 +418,7 @@ class VoiceBot:
         except Exception as e:
             logging.error(f"Error handling speech: {e}")
             voice_bot_spinner.show_error("Processing failed")
-            time.sleep(2)
+            await asyncio.sleep(2)
             voice_bot_spinner.stop()
             voice_bot_spinner.start_listening()  # Resume listening
             if self.on_error:
@@ -368,21 +445,39 @@ class VoiceBot:
         
         try:
             target_language = language or self.current_language
-            self.tts_synthesizer.speak(text, target_language, blocking)
+            # Only blocking speech has a known end to resume listening at
+            with self._listening_paused() if blocking else contextlib.nullcontext():
+                self.tts_synthesizer.speak(text, target_language, blocking)
             logging.info(f"Spoke: {text}")
             
         except Exception as e:
             logging.error(f"TTS error: {e}")
             # Fallback to system TTS
             try:
-                import subprocess
-                subprocess.run(["say", text], check=True)
+                with self._listening_paused():
+                    system_say(text)
                 logging.info("Fallback TTS (system) succeeded")
             except Exception as e2:
                 logging.error(f"Fallback TTS also failed: {e2}")
                 if self.on_error:
                     self.on_error(e)
     
+    @contextlib.contextmanager
+    def _listening_paused(self):
+        """Pause continuous recognition for the duration of blocking speech"""
+        recognizer = self.continuous_recognizer
+        with self._speaking_lock:
+            self._speaking += 1
+            if self._speaking == 1 and recognizer:
+                recognizer.pause()
+        try:
+            yield
+        finally:
+            with self._speaking_lock:
+                self._speaking -= 1
+                if self._speaking == 0 and recognizer:
+                    recognizer.resume()
+    
     def speak_async(self, text: str, language: Optional[str] = None):
         """
         Speak text asynchronously
@@ -390,6 +485,12 @@ class VoiceBot:
         Args:
             text: Text to speak
             language: Language code (if None, uses detected language)
+            
+        Returns:
+            asyncio.Future when called on the orchestrator loop, otherwise
+            the legacy TTS thread. Cancelling the future only skips speech
+            that hasn't started; the synthesizer has no way to interrupt
+            audio that is already playing.
         """
         if not self.tts_synthesizer:
             logging.error("TTS not initialized")
@@ -397,15 +498,29 @@ class VoiceBot:
         
         try:
             target_language = language or self.current_language
-            thread = self.tts_synthesizer.speak_async(text, target_language)
+            
+            if self._loop is not None and self._in_loop_thread():
+                task = self._loop.run_in_executor(None, self.speak, text, target_language)
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            else:
+                task = self.tts_synthesizer.speak_async(text, target_language)
+            
             logging.info(f"Started speaking asynchronously: {text}")
-            return thread
+            return task
             
         except Exception as e:
             logging.error(f"Async TTS error: {e}")
             if self.on_error:
                 self.on_error(e)
     
+    def _in_loop_thread(self) -> bool:
+        """Whether the caller is running on the orchestrator loop"""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+    
     def process_text(self, text: str, language: Optional[str] = None) -> str:
         """
         Process text input and return response
@@ -418,12 +533,14 @@ class VoiceBot:
             Generated response
         """
         try:
+            normalized = text.lower().strip()
+            
             # Detect language if not provided
             if not language:
-                language, _ = self.language_detector.detect_language(text)
+                language, _ = self.language_detector.detect_language_normalized(normalized)
             
             # Process through dialog system
-            response = self.dialog_manager.process_input(text, language)
+            response = self.dialog_manager.process_input_normalized(normalized, language, text)
             
             return response
             
@@ -6,96 +6,336 @@ Main entry point for running the voice bot
 
 import sys
 import os
-import argparse
+import array
+import atexit
+import contextlib
+import functools
 import logging
+import logging.handlers
+import queue
+import re
 import signal
+import socket
+import threading
 import time
+import types
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TYPE_CHECKING
 
-# Add the project root to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import readline  # Line editing and history for input()
+except ImportError:
+    readline = None
 
-from voice_bot import VoiceBot, VoiceBotError
-from voice_bot.logging_utils import setup_single_line_logging, log_and_clear
-from colorama import init, Fore, Style
+if sys.platform == 'win32':
+    from colorama import init, Fore, Style
+else:
+    init = None
+
+    class Fore:
+        """ANSI foreground colors (Unix terminals understand these natively)"""
+        BLACK = '\x1b[30m'
+        RED = '\x1b[31m'
+        GREEN = '\x1b[32m'
+        YELLOW = '\x1b[33m'
+        BLUE = '\x1b[34m'
+        MAGENTA = '\x1b[35m'
+        CYAN = '\x1b[36m'
+        WHITE = '\x1b[37m'
+        RESET = '\x1b[39m'
+
+    class Style:
+        """ANSI text styles"""
+        BRIGHT = '\x1b[1m'
+        DIM = '\x1b[2m'
+        NORMAL = '\x1b[22m'
+        RESET_ALL = '\x1b[0m'
+
+if sys.stdout is None or not sys.stdout.isatty():
+    # Piped or redirected output: emit plain text with no escape codes and
+    # no colorama wrapper at all
+    class _NoColor:
+        """Stand-in for Fore/Style whose attributes are all empty strings"""
+        def __getattr__(self, name):
+            return ''
+
+    Fore = Style = _NoColor()
+    init = None
+
+# Color/style sequences as emitted by Fore and Style
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _input_prompt(prompt: str) -> str:
+    """
+    Prepare a colored prompt for input()
+    
+    readline counts every byte of the prompt as printed width unless escape
+    sequences are wrapped in \\001...\\002, which throws off cursor placement,
+    wrapping and history redraws.
+    """
+    if readline is None:
+        return prompt
+    return _ANSI_ESCAPE.sub(lambda match: '\001' + match.group(0) + '\002', prompt)
+
+
+# The voice_bot package pulls in the audio/ML stack; import it only where it is
+# needed so `--help` and argument errors return immediately
+if TYPE_CHECKING:
+    from voice_bot import VoiceBot
+
+# Shutdown signals are consumed by a dedicated sigwait thread where supported
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+_HAS_SIGWAIT = hasattr(signal, 'pthread_sigmask') and hasattr(signal, 'sigwait')
+# Sent to the main thread to break it out of input() during shutdown; the
+# shutdown signals themselves stay blocked there
+_INPUT_INTERRUPT_SIGNAL = getattr(signal, 'SIGUSR1', None) if _HAS_SIGWAIT else None
+
+
+def _wakeup_only(signum, frame):
+    """No-op Python handler; the wakeup fd carries the signal to a watcher thread"""
+
+
+@contextlib.contextmanager
+def _shutdown_signals_blocked():
+    """Block shutdown signals while starting helper threads so they inherit the mask"""
+    if not _HAS_SIGWAIT:
+        yield
+        return
+    
+    previous = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+    try:
+        yield
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, previous)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes and flushes periodically or on ERROR"""
+    
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = None,
+                 delay: bool = False, buffer_size: int = 8192, flush_interval: float = 1.0,
+                 periodic_flush: Optional[Callable[[], None]] = None):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        # Lets a buffering handler in front of this one drain on the same timer
+        self.periodic_flush = periodic_flush or self.flush
+        super().__init__(filename, mode, encoding, delay)
+        
+        # Periodic flush so buffered records still reach disk promptly
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="debug-log-flusher", daemon=True)
+        with _shutdown_signals_blocked():
+            self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            # Only ERROR and above pay for an immediate write()
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self):
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.periodic_flush()
+    
+    def close(self):
+        self._stop_flusher.set()
+        super().close()
+
+
+# Full debug logging only when explicitly requested (or with --verbose);
+# otherwise just warnings and errors reach the debug file
+CLI_DEBUG = os.environ.get('VOICE_BOT_DEBUG') == '1'
 
 # Setup debug logging for iTerm troubleshooting
 DEBUG_LOG = logging.getLogger('voice_bot_debug')
-DEBUG_LOG.setLevel(logging.DEBUG)
+DEBUG_LOG.setLevel(logging.DEBUG if CLI_DEBUG else logging.WARNING)
+# The debug log has its own file (and optional stdout echo); keep its records
+# off the root logger's single-line console handler
+DEBUG_LOG.propagate = False
+
 
-# Create debug log file
-debug_handler = logging.FileHandler('voice_bot_debug.log')
+def flush_debug_log():
+    """Write any buffered debug records to disk"""
+    debug_memory.flush()
+    debug_handler.flush()
+
+
+# Create debug log file; its timer drains the memory buffer as well
+debug_handler = BufferedFileHandler('voice_bot_debug.log', delay=True,
+                                    periodic_flush=flush_debug_log)
 debug_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 debug_handler.setFormatter(debug_formatter)
-DEBUG_LOG.addHandler(debug_handler)
 
-def debug_log(message: str, level: str = "INFO"):
-    """Enhanced debug logging with terminal info"""
-    terminal = os.environ.get('TERM_PROGRAM', 'Unknown')
-    is_iterm = 'iTerm' in terminal
-    full_message = f"[{terminal}|iTerm:{is_iterm}] {message}"
-    
-    if level == "DEBUG":
-        DEBUG_LOG.debug(full_message)
-        print(f"{Fore.BLUE}🐛 DEBUG: {full_message}{Style.RESET_ALL}")
-    elif level == "WARNING":
-        DEBUG_LOG.warning(full_message)
-        print(f"{Fore.YELLOW}⚠️  WARN: {full_message}{Style.RESET_ALL}")
-    elif level == "ERROR":
-        DEBUG_LOG.error(full_message)
-        print(f"{Fore.RED}❌ ERROR: {full_message}{Style.RESET_ALL}")
+# Hand records to the file in batches; ERROR and above go through at once
+debug_memory = logging.handlers.MemoryHandler(capacity=256, flushLevel=logging.ERROR,
+                                              target=debug_handler)
+
+# Move debug file I/O off the calling thread
+debug_queue = queue.SimpleQueue()
+debug_listener = logging.handlers.QueueListener(debug_queue, debug_memory,
+                                                respect_handler_level=True)
+DEBUG_LOG.addHandler(logging.handlers.QueueHandler(debug_queue))
+with _shutdown_signals_blocked():
+    debug_listener.start()
+atexit.register(debug_listener.stop)
+
+
+# Checked first in debug_log so DEBUG calls cost a single compare when off
+_DEBUG_ENABLED = DEBUG_LOG.isEnabledFor(logging.DEBUG)
+
+
+def reconfigure(verbose: bool):
+    """
+    Set the debug log level for this run
+    
+    Args:
+        verbose: Keep DEBUG records; otherwise log INFO and above with
+            VOICE_BOT_DEBUG=1, WARNING and above without it
+    """
+    global _DEBUG_ENABLED
+    if verbose:
+        DEBUG_LOG.setLevel(logging.DEBUG)
     else:
-        DEBUG_LOG.info(full_message)
-        print(f"{Fore.GREEN}ℹ️  INFO: {full_message}{Style.RESET_ALL}")
+        DEBUG_LOG.setLevel(logging.INFO if CLI_DEBUG else logging.WARNING)
+    _DEBUG_ENABLED = DEBUG_LOG.isEnabledFor(logging.DEBUG)
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# Terminal info never changes during a run, so resolve it once
+TERM_PROGRAM = os.environ.get('TERM_PROGRAM', 'Unknown')
+IS_ITERM = 'iTerm' in TERM_PROGRAM
 
-# Check for iTerm compatibility
-IS_ITERM = 'iTerm' in os.environ.get('TERM_PROGRAM', '')
+# Echo debug records to stdout only when explicitly requested
+CLI_DEBUG_STDOUT = os.environ.get('VOICE_BOT_DEBUG_STDOUT') == '1'
 
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
 
-class VoiceBotCLI:
-    """Command Line Interface for Voice Bot"""
+DEBUG_STYLES = {
+    logging.DEBUG: (Fore.BLUE, "🐛 DEBUG"),
+    logging.INFO: (Fore.GREEN, "ℹ️  INFO"),
+    logging.WARNING: (Fore.YELLOW, "⚠️  WARN"),
+    logging.ERROR: (Fore.RED, "❌ ERROR"),
+}
+
+def debug_log(message: str, level: str = "INFO"):
+    """Enhanced debug logging with terminal info"""
+    if level == "DEBUG" and not _DEBUG_ENABLED:
+        return
     
-    def __init__(self):
-        """Initialize CLI"""
-        debug_log("Initializing VoiceBotCLI", "DEBUG")
-        self.voice_bot: Optional[VoiceBot] = None
-        self.running = False
-        self.conversation_context = []  # Store conversation history
-        self.conversation_state = "idle"  # Track conversation state
-        
-        # Set up signal handlers for graceful shutdown
-        debug_log("Setting up signal handlers", "DEBUG")
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        debug_log("Signal handlers configured", "DEBUG")
+    levelno = LOG_LEVELS.get(level, logging.INFO)
+    if not DEBUG_LOG.isEnabledFor(levelno):
+        return
     
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals with iTerm compatibility"""
-        debug_log(f"Signal handler called with signal {signum}", "DEBUG")
-        print(f"\n{Fore.YELLOW}Received signal {signum}. Shutting down gracefully...{Style.RESET_ALL}")
-        self.stop()
-        
-        # Enhanced exit for iTerm compatibility
-        if IS_ITERM:
-            debug_log("Using iTerm-compatible exit (os._exit)", "DEBUG")
-            print(f"{Fore.BLUE}🔧 iTerm: Performing enhanced shutdown...{Style.RESET_ALL}")
-            # Force exit for iTerm to prevent hanging
-            os._exit(0)
-        else:
-            debug_log("Using standard exit (sys.exit)", "DEBUG")
-            sys.exit(0)
+    full_message = f"[{TERM_PROGRAM}|iTerm:{IS_ITERM}] {message}"
+    DEBUG_LOG.log(levelno, full_message)
     
-    def setup_logging(self, verbose: bool = False):
-        """Setup logging configuration"""
-        self.log_handler = setup_single_line_logging(verbose=verbose)
+    if CLI_DEBUG_STDOUT:
+        color, prefix = DEBUG_STYLES[levelno]
+        # Straight to the fd: one syscall, no TextIOWrapper encode/lock
+        write_stdout_bytes(f"{color}{prefix}: {full_message}{Style.RESET_ALL}\n".encode())
+
+# Multi-line mode intros and help, each emitted with one write
+_INTERACTIVE_INTRO = (
+    f"\n{Fore.CYAN}💬 Interactive Mode - Type commands or press Ctrl+C to exit{Style.RESET_ALL}\n"
+    f"{Fore.GREEN}✅ Voice Bot ready for text processing!{Style.RESET_ALL}\n"
+    f"{Fore.YELLOW}💡 Try: 'text Hello' to test the bot{Style.RESET_ALL}\n"
+    f"{Fore.BLUE}💡 Voice visualizer will show when processing{Style.RESET_ALL}\n"
+)
+
+_MANUAL_INTRO = (
+    f"\n{Fore.CYAN}🎤 Manual Mode - Press 's' + Enter to record, 't' + Enter to stop{Style.RESET_ALL}\n"
+    f"{Fore.YELLOW}💡 Controls: 's' + Enter = start, 't' + Enter = stop, 'q' + Enter = quit, 'h' + Enter = help{Style.RESET_ALL}\n"
+    f"{Fore.GREEN}🤖 Dialog Integration: Intelligent responses with language detection and context awareness{Style.RESET_ALL}\n"
+)
+
+_MANUAL_READY = (
+    f"{Fore.GREEN}🎤 Manual recording ready{Style.RESET_ALL}\n"
+    f"{Fore.WHITE}💡 Type 's' + Enter to start recording{Style.RESET_ALL}\n"
+    f"{Fore.WHITE}💡 Type 't' + Enter to stop recording{Style.RESET_ALL}\n"
+    f"{Fore.WHITE}💡 Type 'q' + Enter to quit{Style.RESET_ALL}\n"
+    f"{Fore.WHITE}💡 Type 'h' + Enter for help{Style.RESET_ALL}\n"
+)
+
+_MANUAL_HELP = (
+    f"{Fore.CYAN}Commands (type + Enter):{Style.RESET_ALL}\n"
+    f"  {Fore.WHITE}s / start{Style.RESET_ALL} - Begin recording\n"
+    f"  {Fore.WHITE}t / stop{Style.RESET_ALL}  - Stop recording and process through dialog system\n"
+    f"  {Fore.WHITE}q / quit{Style.RESET_ALL}  - Exit the bot\n"
+    f"  {Fore.WHITE}h / help{Style.RESET_ALL}  - Show this help\n"
+    f"  {Fore.WHITE}c / context{Style.RESET_ALL} - Show conversation history\n"
+    f"  {Fore.WHITE}clear{Style.RESET_ALL} - Clear conversation history\n"
+    f"\n{Fore.YELLOW}💡 Dialog Integration:{Style.RESET_ALL}\n"
+    f"  {Fore.GREEN}✅ Intelligent responses{Style.RESET_ALL} - Uses dialog system instead of echo\n"
+    f"  {Fore.GREEN}✅ Language detection{Style.RESET_ALL} - Automatically detects English/Hindi\n"
+    f"  {Fore.GREEN}✅ Context awareness{Style.RESET_ALL} - Maintains conversation context\n"
+    f"  {Fore.GREEN}✅ Error handling{Style.RESET_ALL} - Graceful fallback responses\n"
+    f"\n{Fore.YELLOW}💡 Remember: Type the command and press Enter!{Style.RESET_ALL}\n"
+)
+
+# Manual mode command aliases
+_CMD_START = frozenset({'s', 'start'})
+_CMD_STOP = frozenset({'t', 'stop'})
+_CMD_QUIT = frozenset({'q', 'quit', 'exit'})
+_CMD_HELP = frozenset({'h', 'help'})
+_CMD_CONTEXT = frozenset({'c', 'context'})
+
+
+# Only Windows consoles need colorama's converting stream wrapper, and only
+# once there is colored output to convert (not for --help)
+_colorama_ready = False
+
+
+def _ensure_colorama():
+    """Install colorama's stdout wrapper once, where it is needed"""
+    global _colorama_ready
+    if init is not None and not _colorama_ready:
+        init(autoreset=True)
+        _colorama_ready = True
+
+
+def write_stdout_bytes(data: bytes):
+    """Write preformatted bytes directly to the stdout file descriptor"""
+    try:
+        fd = sys.stdout.fileno() if init is None else None
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None:
+        # Captured stream or Windows console: go through sys.stdout
+        sys.stdout.write(data.decode('utf-8', 'replace'))
+        return
     
-    def print_banner(self):
-        """Print welcome banner"""
-        banner = f"""
+    # Keep ordering with regular print() output
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# Callback lines are preformatted so speech events cost one os.write()
+_USER_PREFIX = f"\n{Fore.GREEN}👤 You: ".encode()
+_BOT_PREFIX = f"{Fore.BLUE}🤖 Bot: ".encode()
+_LANGUAGE_LINES = {
+    "en": f"{Fore.MAGENTA}🌐 Language: English{Style.RESET_ALL}\n".encode(),
+    "hi": f"{Fore.MAGENTA}🌐 Language: Hindi{Style.RESET_ALL}\n".encode(),
+}
+_ERROR_PREFIX = f"{Fore.RED}❌ Error: ".encode()
+_LINE_SUFFIX = f"{Style.RESET_ALL}\n".encode()
+
+# Static CLI text is colored once here; print_* methods emit it in one write
+_BANNER = f"""
 {Fore.CYAN}╔══════════════════════════════════════════════════════════════╗
 ║                    Voice Bot CLI v1.0.0                    ║
 ║              Multilingual Voice Assistant                  ║
@@ -110,22 +350,10 @@ class VoiceBotCLI:
    • Press Ctrl+C to exit
 
 {Fore.BLUE}🔊 Starting voice bot...{Style.RESET_ALL}
+
 """
-        print(banner)
-    
-    def print_status(self, status: dict):
-        """Print bot status information"""
-        print(f"\n{Fore.CYAN}📊 Bot Status:{Style.RESET_ALL}")
-        print(f"   Running: {Fore.GREEN if status['is_running'] else Fore.RED}{status['is_running']}{Style.RESET_ALL}")
-        print(f"   Listening: {Fore.GREEN if status['is_listening'] else Fore.RED}{status['is_listening']}{Style.RESET_ALL}")
-        print(f"   Language: {Fore.BLUE}{status['current_language']}{Style.RESET_ALL}")
-        print(f"   ASR Engines: {Fore.BLUE}{', '.join(status['available_engines'])}{Style.RESET_ALL}")
-        print(f"   TTS Languages: {Fore.BLUE}{', '.join(status['available_languages'])}{Style.RESET_ALL}")
-        print(f"   Supported Intents: {Fore.BLUE}{len(status['supported_intents'])}{Style.RESET_ALL}")
-    
-    def print_help(self):
-        """Print help information"""
-        help_text = f"""
+
+_HELP = f"""
 {Fore.CYAN}🤖 Voice Bot Commands:{Style.RESET_ALL}
 
 {Fore.GREEN}Voice Commands:{Style.RESET_ALL}
@@ -153,36 +381,220 @@ class VoiceBotCLI:
    • Natural language understanding
    • Multilingual text-to-speech
    • Conversation history
+
 """
-        print(help_text)
+
+
+# Model directories already seen on disk; misses are re-checked so a
+# directory created (e.g. downloaded) mid-session is picked up
+_MODELS_DIRS_FOUND = set()
+
+
+def _models_dir_ok(path_str: str) -> bool:
+    """Check whether a models directory exists (stat once per existing path)"""
+    if path_str in _MODELS_DIRS_FOUND:
+        return True
+    if Path(path_str).exists():
+        _MODELS_DIRS_FOUND.add(path_str)
+        return True
+    return False
+
+
+class VoiceBotCLI:
+    """Command Line Interface for Voice Bot"""
+    
+    # Status block filled with one % operation per print_status call
+    _STATUS_TMPL = (
+        "\n" + Fore.CYAN + "📊 Bot Status:" + Style.RESET_ALL +
+        "\n   Running: %s%s" + Style.RESET_ALL +
+        "\n   Listening: %s%s" + Style.RESET_ALL +
+        "\n   Language: " + Fore.BLUE + "%s" + Style.RESET_ALL +
+        "\n   ASR Engines: " + Fore.BLUE + "%s" + Style.RESET_ALL +
+        "\n   TTS Languages: " + Fore.BLUE + "%s" + Style.RESET_ALL +
+        "\n   Supported Intents: " + Fore.BLUE + "%d" + Style.RESET_ALL + "\n"
+    )
+    
+    def __init__(self):
+        """Initialize CLI"""
+        _ensure_colorama()
+        debug_log("Initializing VoiceBotCLI", "DEBUG")
+        self.voice_bot: Optional["VoiceBot"] = None
+        self.running = False
+        # Conversation history as parallel columns, one entry per turn
+        self._ctx_inputs = []
+        self._ctx_responses = []
+        self._ctx_langs = []
+        self._ctx_conf = array.array('d')
+        self._ctx_ts = array.array('d')
+        # Repeated manual-mode utterances skip language detection
+        self._detect_language = functools.lru_cache(maxsize=128)(self._detect_language_uncached)
+        self.conversation_state = "idle"  # Track conversation state
+        self._stop_event = threading.Event()  # Set on shutdown to wake run_voice_mode
+        self._waiting_for_stop = False  # True while run_voice_mode blocks on _stop_event
+        self._shutting_down = False  # Set by the first shutdown signal
+        self._in_input_loop = False  # True while the main thread runs an input() loop
+        # Colored prompts, built once instead of per input() call
+        self._prompt = _input_prompt(f"\n{Fore.BLUE}voice-bot> {Style.RESET_ALL}")
+        self._manual_prompt = _input_prompt(f"\n{Fore.CYAN}Voice Bot> {Style.RESET_ALL}")
+        self._ticker_unavailable = False  # Set once the visualizer import fails
+        self._ticker = None  # Shared ticker instance, created on first use
+        self._tts_pool = None  # Single worker running system 'say', created on first use
+        self.models_dir = _DEFAULTS['models_dir']  # Set from args by initialize_bot
+        self._models_dir: Optional[Path] = None
+        self._models_dir_arg: Optional[str] = None
+        
+        # Interactive command verb -> handler taking the rest of the line
+        self._dispatch = {
+            'help': self._cmd_help,
+            'status': self._cmd_status,
+            'history': self._cmd_history,
+            'clear': self._cmd_clear,
+            'speak': self._cmd_speak,
+            'text': self._cmd_text,
+            'quit': self._cmd_quit,
+            'exit': self._cmd_quit,
+            'q': self._cmd_quit,
+        }
+    
+    def install_signal_handlers(self):
+        """Set up signal handling for graceful shutdown"""
+        debug_log("Setting up signal handlers", "DEBUG")
+        if _HAS_SIGWAIT:
+            # Mask the signals here (inherited by every thread started later)
+            # and receive them synchronously on a dedicated thread
+            signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+            threading.Thread(target=self._sigwait_loop, name="signal-waiter", daemon=True).start()
+            if _INPUT_INTERRUPT_SIGNAL is not None:
+                # Raises KeyboardInterrupt in the main thread, like Ctrl+C did
+                signal.signal(_INPUT_INTERRUPT_SIGNAL, signal.default_int_handler)
+        else:
+            # No sigwait (Windows): the C-level handler writes the signal number
+            # to a wakeup socket and a watcher thread does the actual shutdown
+            reader, writer = socket.socketpair()
+            writer.setblocking(False)
+            signal.set_wakeup_fd(writer.fileno())
+            self._wakeup_sockets = (reader, writer)
+            for signum in _SHUTDOWN_SIGNALS:
+                signal.signal(signum, _wakeup_only)
+            threading.Thread(target=self._wakeup_fd_loop, args=(reader,),
+                             name="signal-waiter", daemon=True).start()
+        debug_log("Signal handlers configured", "DEBUG")
+    
+    def _sigwait_loop(self):
+        """Receive shutdown signals via sigwait for the life of the process"""
+        while True:
+            self._on_shutdown_signal(signal.sigwait(_SHUTDOWN_SIGNALS))
+    
+    def _wakeup_fd_loop(self, reader: socket.socket):
+        """Receive shutdown signals via the wakeup socket"""
+        while True:
+            data = reader.recv(1)
+            if not data:
+                self._on_shutdown_signal(signal.SIGTERM)
+                return
+            if data[0] in _SHUTDOWN_SIGNALS:
+                self._on_shutdown_signal(data[0])
+    
+    def _on_shutdown_signal(self, signum: int):
+        """Start a graceful shutdown; a repeated signal forces the exit"""
+        if self._shutting_down:
+            # stop() is stuck somewhere; don't leave the user with only SIGKILL
+            print(f"\n{Fore.RED}Received signal {signum} during shutdown. Forcing exit.{Style.RESET_ALL}", flush=True)
+            os._exit(1)
+        
+        # Shut down on another thread so this one keeps receiving signals
+        self._shutting_down = True
+        threading.Thread(target=self._handle_shutdown_signal, args=(signum,),
+                         name="shutdown", daemon=True).start()
+    
+    def _handle_shutdown_signal(self, signum: int):
+        """Stop the bot after a shutdown signal, in normal thread context"""
+        debug_log(f"Signal thread received signal {signum}", "DEBUG")
+        print(f"\n{Fore.YELLOW}Received signal {signum}. Shutting down gracefully...{Style.RESET_ALL}")
+        self.stop()
+        
+        # Voice mode unwinds through _stop_event and the input modes through
+        # KeyboardInterrupt, so their cleanup and main()'s still run
+        if IS_ITERM or not (self._waiting_for_stop or self._interrupt_input_loop()):
+            debug_log("Exiting from signal thread (os._exit)", "DEBUG")
+            debug_listener.stop()
+            flush_debug_log()
+            os._exit(0)
+    
+    def _interrupt_input_loop(self) -> bool:
+        """Break the main thread out of input(); False if there is no loop to break"""
+        if not self._in_input_loop or _INPUT_INTERRUPT_SIGNAL is None:
+            return False
+        signal.pthread_kill(threading.main_thread().ident, _INPUT_INTERRUPT_SIGNAL)
+        return True
+    
+    def setup_logging(self, verbose: bool = False):
+        """Setup logging configuration"""
+        reconfigure(verbose)
+        from voice_bot.logging_utils import setup_single_line_logging
+        self.log_handler = setup_single_line_logging(verbose=verbose)
+    
+    def print_banner(self):
+        """Print welcome banner"""
+        sys.stdout.write(_BANNER)
+    
+    def print_status(self, status: dict):
+        """Print bot status information"""
+        run_color = Fore.GREEN if status['is_running'] else Fore.RED
+        listen_color = Fore.GREEN if status['is_listening'] else Fore.RED
+        sys.stdout.write(self._STATUS_TMPL % (
+            run_color, status['is_running'],
+            listen_color, status['is_listening'],
+            status['current_language'],
+            ', '.join(status['available_engines']),
+            ', '.join(status['available_languages']),
+            len(status['supported_intents']),
+        ))
+    
+    def print_help(self):
+        """Print help information"""
+        sys.stdout.write(_HELP)
     
     def initialize_bot(self, args) -> bool:
         """Initialize voice bot with given arguments"""
-        debug_log("Initializing voice bot with arguments", "DEBUG")
-        debug_log(f"Models dir: {args.models_dir}", "DEBUG")
-        debug_log(f"Vosk EN model: {args.vosk_en_model}", "DEBUG")
-        debug_log(f"Vosk HI model: {args.vosk_hi_model}", "DEBUG")
-        debug_log(f"TTS language: {args.tts_language}", "DEBUG")
+        if DEBUG_LOG.isEnabledFor(logging.DEBUG):
+            # One lazily formatted record instead of a debug_log call per argument
+            DEBUG_LOG.debug("Initializing voice bot: models_dir=%s vosk_en=%s vosk_hi=%s "
+                            "tts=%s sample_rate=%s chunk=%s",
+                            args.models_dir, args.vosk_en_model, args.vosk_hi_model,
+                            args.tts_language, args.sample_rate, args.chunk_size)
+        
+        try:
+            from voice_bot import VoiceBot, VoiceBotError
+        except ImportError as e:
+            debug_log(f"Failed to import voice_bot: {e}", "ERROR")
+            print(f"{Fore.RED}❌ Failed to import Voice Bot: {e}{Style.RESET_ALL}")
+            return False
         
         try:
             # Check if models directory exists
-            models_dir = Path(args.models_dir)
+            # Resolve the path once and keep it for manual mode and later calls
+            if self._models_dir is None or self._models_dir_arg != args.models_dir:
+                self._models_dir_arg = args.models_dir
+                self._models_dir = Path(args.models_dir).resolve()
+                self.models_dir = str(self._models_dir)
+            models_dir = self._models_dir
             debug_log(f"Checking models directory: {models_dir}", "DEBUG")
-            if not models_dir.exists():
+            if not _models_dir_ok(self.models_dir):
                 debug_log(f"Models directory not found: {models_dir}", "ERROR")
                 print(f"{Fore.YELLOW}⚠️  Models directory not found: {models_dir}{Style.RESET_ALL}")
                 print(f"{Fore.YELLOW}   Run: python download_models.py --all{Style.RESET_ALL}")
                 return False
             
-            # Show loading progress
-            print(f"{Fore.BLUE}💡 Loading models - this may take 10-20 seconds{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}⏳ Please wait while models are loading...{Style.RESET_ALL}")
+            # One flushed notice instead of a progress display competing with the loaders
+            print(f"{Fore.YELLOW}⏳ Loading models - this may take 10-20 seconds...{Style.RESET_ALL}", flush=True)
+            load_start = time.monotonic()
             
             # Initialize voice bot (this is where the "hanging" happens)
             debug_log("Creating VoiceBot instance", "DEBUG")
             debug_log("This is where model loading happens - may take time", "INFO")
             self.voice_bot = VoiceBot(
-                models_dir=args.models_dir,
+                models_dir=self.models_dir,
                 vosk_en_model=args.vosk_en_model,
                 vosk_hi_model=args.vosk_hi_model,
                 tts_language=args.tts_language,
@@ -190,6 +602,8 @@ class VoiceBotCLI:
                 sample_rate=args.sample_rate,
                 chunk_size=args.chunk_size
             )
+            load_time = time.monotonic() - load_start
+            debug_log(f"Models loaded in {load_time:.1f}s", "INFO")
             
             # Set up callbacks
             self.voice_bot.on_speech_detected = self._on_speech_detected
@@ -197,7 +611,7 @@ class VoiceBotCLI:
             self.voice_bot.on_language_detected = self._on_language_detected
             self.voice_bot.on_error = self._on_error
             
-            print(f"\n{Fore.GREEN}✅ Voice Bot initialized successfully!{Style.RESET_ALL}")
+            print(f"\n{Fore.GREEN}✅ Voice Bot initialized successfully! ({load_time:.1f}s){Style.RESET_ALL}")
             # Clear the logging line
             if hasattr(self, 'log_handler'):
                 self.log_handler.clear_line()
@@ -231,20 +645,9 @@ class VoiceBotCLI:
             startup_message = "Hey, We ready to rumble! Let us go"
             print(f"{Fore.MAGENTA}🔊 Startup: {startup_message}{Style.RESET_ALL}")
             
-            # Try system TTS first (most reliable)
-            try:
-                import subprocess
-                subprocess.run(["say", startup_message], check=True)
-                print(f"{Fore.GREEN}✅ Startup announcement played via system TTS{Style.RESET_ALL}")
-            except Exception as e:
-                debug_log(f"System TTS failed: {e}", "WARNING")
-                # Fallback to voice bot TTS
-                try:
-                    self.voice_bot.speak(startup_message)
-                    print(f"{Fore.GREEN}✅ Startup announcement played via voice bot TTS{Style.RESET_ALL}")
-                except Exception as e2:
-                    debug_log(f"Voice bot TTS also failed: {e2}", "ERROR")
-                    print(f"{Fore.RED}❌ Startup announcement failed completely{Style.RESET_ALL}")
+            # System TTS first (most reliable), voice bot TTS if that fails;
+            # played on the TTS worker so startup does not wait for it
+            self._say(startup_message, fallback=self.voice_bot.speak)
             
             # Clear the logging line
             if hasattr(self, 'log_handler'):
@@ -264,61 +667,116 @@ class VoiceBotCLI:
                 print(f"{Fore.YELLOW}🛑 Voice Bot stopped{Style.RESET_ALL}")
             except Exception as e:
                 print(f"{Fore.RED}❌ Error stopping Voice Bot: {e}{Style.RESET_ALL}")
+        
+        # Drop queued announcements; one already playing finishes on its own
+        if self._tts_pool is not None:
+            try:
+                self._tts_pool.shutdown(wait=False, cancel_futures=True)
+            except TypeError:  # Python 3.8 has no cancel_futures
+                self._tts_pool.shutdown(wait=False)
+            self._tts_pool = None
+        
+        # Wake run_voice_mode only once shutdown is done, so the main thread
+        # doesn't run its own stop() alongside this one
+        self._stop_event.set()
+        
+        # Drain buffered debug records on shutdown
+        flush_debug_log()
+    
+    @property
+    def conversation_context(self):
+        """Conversation history as one dict per turn (built on demand).
+        
+        The returned list is a snapshot; record turns with add_turn() or
+        replace the whole history by assigning to this property.
+        """
+        return [
+            {'turn': i, 'input': text, 'response': response, 'language': language,
+             'confidence': confidence, 'timestamp': timestamp}
+            for i, (text, response, language, confidence, timestamp) in enumerate(
+                zip(self._ctx_inputs, self._ctx_responses, self._ctx_langs,
+                    self._ctx_conf, self._ctx_ts), 1)
+        ]
+    
+    @conversation_context.setter
+    def conversation_context(self, turns):
+        """Replace the conversation history with a list of turn dicts"""
+        self._clear_context_columns()
+        for turn in turns:
+            self.add_turn(turn['input'], turn['response'], turn.get('language', 'en'),
+                          turn.get('confidence', 0.0), turn.get('timestamp'))
+    
+    def add_turn(self, text, response, language, confidence=0.0, timestamp=None):
+        """Append one conversation turn to the history columns"""
+        self._ctx_inputs.append(text)
+        self._ctx_responses.append(response)
+        self._ctx_langs.append(language)
+        self._ctx_conf.append(confidence)
+        self._ctx_ts.append(time.time() if timestamp is None else timestamp)
+    
+    def _clear_context_columns(self):
+        """Empty every conversation history column"""
+        self._ctx_inputs.clear()
+        self._ctx_responses.clear()
+        self._ctx_langs.clear()
+        del self._ctx_conf[:]  # array.array has no clear()
+        del self._ctx_ts[:]
+    
+    def _clear_context(self):
+        """Forget manual-mode conversation history"""
+        self._clear_context_columns()
+        self._detect_language.cache_clear()
+        self.conversation_state = "idle"
+    
+    def _detect_language_uncached(self, text: str):
+        """Detect the language of a transcript (wrapped by an LRU cache in __init__)"""
+        return tuple(self.voice_bot.language_detector.detect_language(text))
+    
+    def _say(self, text: str, fallback=None):
+        """Queue text for the system 'say' command without blocking the caller"""
+        if self._tts_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="say")
+        return self._tts_pool.submit(self._run_say, text, fallback)
+    
+    @staticmethod
+    def _run_say(text: str, fallback=None) -> bool:
+        """Speak text with the system 'say' command (runs on the TTS worker)"""
+        try:
+            from voice_bot.tts import system_say
+            system_say(text)
+            return True
+        except Exception as e:
+            debug_log(f"System TTS failed: {e}", "WARNING")
+            if fallback is None:
+                return False
+            try:
+                fallback(text)
+                return True
+            except Exception as e2:
+                debug_log(f"Fallback TTS also failed: {e2}", "ERROR")
+                return False
     
     def run_interactive_mode(self):
         """Run interactive command mode"""
-        print(f"\n{Fore.CYAN}💬 Interactive Mode - Type commands or press Ctrl+C to exit{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}✅ Voice Bot ready for text processing!{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}💡 Try: 'text Hello' to test the bot{Style.RESET_ALL}")
-        print(f"{Fore.BLUE}💡 Voice visualizer will show when processing{Style.RESET_ALL}")
+        sys.stdout.write(_INTERACTIVE_INTRO)
         
         # Set running to True for interactive mode
         self.running = True
+        self._in_input_loop = True
         
         while self.running:
             try:
-                command = input(f"\n{Fore.BLUE}voice-bot> {Style.RESET_ALL}").strip().lower()
+                command = input(self._prompt).strip()
                 
                 if not command:
                     continue
                 
-                if command in ['quit', 'exit', 'q']:
-                    break
-                elif command == 'help':
-                    self.print_help()
-                elif command == 'status':
-                    if self.voice_bot:
-                        status = self.voice_bot.get_status()
-                        self.print_status(status)
-                elif command == 'history':
-                    if self.voice_bot:
-                        history = self.voice_bot.get_conversation_history()
-                        self._print_history(history)
-                elif command == 'clear':
-                    if self.voice_bot:
-                        self.voice_bot.clear_conversation_history()
-                        print(f"{Fore.GREEN}✅ Conversation history cleared{Style.RESET_ALL}")
-                elif command.startswith('speak '):
-                    text = command[6:]  # Remove 'speak ' prefix
-                    if self.voice_bot:
-                        print(f"{Fore.MAGENTA}🔊 Speaking: '{text}'{Style.RESET_ALL}")
-                        self.voice_bot.speak(text)
-                    else:
-                        print(f"{Fore.RED}❌ Voice bot not initialized{Style.RESET_ALL}")
-                elif command.startswith('text '):
-                    text = command[5:]  # Remove 'text ' prefix
-                    if self.voice_bot:
-                        # Show processing visualizer
-                        from voice_visualizer_fixed import SimpleVoiceTicker
-                        ticker = SimpleVoiceTicker()
-                        ticker.start()
-                        
-                        try:
-                            response = self.voice_bot.process_text(text)
-                            print(f"\n{Fore.GREEN}Bot: {response}{Style.RESET_ALL}")
-                            self.voice_bot.speak(response)
-                        finally:
-                            ticker.stop()
+                # Match the verb case-insensitively but keep the argument's casing
+                verb, _, rest = command.partition(' ')
+                handler = self._dispatch.get(verb.lower())
+                if handler is not None:
+                    handler(rest.strip())
                 else:
                     print(f"{Fore.YELLOW}Unknown command: {command}{Style.RESET_ALL}")
                     print(f"{Fore.YELLOW}Type 'help' for available commands{Style.RESET_ALL}")
@@ -329,6 +787,75 @@ class VoiceBotCLI:
                 break
             except Exception as e:
                 print(f"{Fore.RED}❌ Error: {e}{Style.RESET_ALL}")
+        
+        self._in_input_loop = False
+    
+    def _get_ticker(self):
+        """Get the shared voice ticker (None if the visualizer is unavailable)"""
+        if self._ticker is None and not self._ticker_unavailable:
+            # Imported on first use: the visualizer pulls in numpy
+            try:
+                from voice_visualizer_fixed import SimpleVoiceTicker
+            except ImportError:
+                self._ticker_unavailable = True
+                return None
+            debug_log("Creating voice ticker", "DEBUG")
+            self._ticker = SimpleVoiceTicker()
+        return self._ticker
+    
+    def _cmd_quit(self, rest: str = ""):
+        """Leave interactive mode"""
+        self.running = False
+    
+    def _cmd_help(self, rest: str = ""):
+        """Show help"""
+        self.print_help()
+    
+    def _cmd_status(self, rest: str = ""):
+        """Show bot status"""
+        if self.voice_bot:
+            status = self.voice_bot.get_status()
+            self.print_status(status)
+    
+    def _cmd_history(self, rest: str = ""):
+        """Show conversation history"""
+        if self.voice_bot:
+            history = self.voice_bot.get_conversation_history()
+            self._print_history(history)
+    
+    def _cmd_clear(self, rest: str = ""):
+        """Clear conversation history"""
+        if self.voice_bot:
+            self.voice_bot.clear_conversation_history()
+            print(f"{Fore.GREEN}✅ Conversation history cleared{Style.RESET_ALL}")
+    
+    def _cmd_speak(self, text: str):
+        """Speak the given text"""
+        if not text:
+            print(f"{Fore.YELLOW}Usage: speak <text>{Style.RESET_ALL}")
+        elif self.voice_bot:
+            print(f"{Fore.MAGENTA}🔊 Speaking: '{text}'{Style.RESET_ALL}")
+            self.voice_bot.speak(text)
+        else:
+            print(f"{Fore.RED}❌ Voice bot not initialized{Style.RESET_ALL}")
+    
+    def _cmd_text(self, text: str):
+        """Process text through the bot and speak the response"""
+        if not text:
+            print(f"{Fore.YELLOW}Usage: text <message>{Style.RESET_ALL}")
+        elif self.voice_bot:
+            # Show processing visualizer
+            ticker = self._get_ticker()
+            if ticker:
+                ticker.start()
+            
+            try:
+                response = self.voice_bot.process_text(text)
+                print(f"\n{Fore.GREEN}Bot: {response}{Style.RESET_ALL}")
+                self.voice_bot.speak(response)
+            finally:
+                if ticker:
+                    ticker.stop()
     
     def run_voice_mode(self):
         """Run voice-only mode with voice visualizer"""
@@ -336,34 +863,43 @@ class VoiceBotCLI:
         print(f"\n{Fore.CYAN}🎤 Voice Mode - Speak naturally or press Ctrl+C to exit{Style.RESET_ALL}")
         
         # Start voice visualizer
-        debug_log("Importing SimpleVoiceTicker", "DEBUG")
-        from voice_visualizer_fixed import SimpleVoiceTicker
-        debug_log("Creating voice ticker", "DEBUG")
-        voice_ticker = SimpleVoiceTicker()
-        debug_log("Starting voice ticker", "DEBUG")
-        voice_ticker.start()
-        debug_log("Voice ticker started", "INFO")
+        voice_ticker = self._get_ticker()
+        if voice_ticker:
+            debug_log("Starting voice ticker", "DEBUG")
+            voice_ticker.start()
+            debug_log("Voice ticker started", "INFO")
+        else:
+            debug_log("Voice visualizer unavailable, running without ticker", "WARNING")
         
         try:
             debug_log("Entering voice mode main loop", "DEBUG")
-            while self.running:
-                time.sleep(0.1)  # Small delay to prevent high CPU usage
+            if self.running:
+                # Block until stop() or a signal sets the event
+                self._waiting_for_stop = True
+                self._stop_event.wait()
         except KeyboardInterrupt:
             debug_log("KeyboardInterrupt received in voice mode", "DEBUG")
             pass
         finally:
             # Stop voice visualizer
-            debug_log("Stopping voice ticker", "DEBUG")
-            voice_ticker.stop()
-            debug_log("Voice ticker stopped", "DEBUG")
+            if voice_ticker:
+                debug_log("Stopping voice ticker", "DEBUG")
+                voice_ticker.stop()
+                debug_log("Voice ticker stopped", "DEBUG")
 
     def run_manual_mode(self):
         """Run manual recording mode with transcription"""
         debug_log("Starting manual mode", "DEBUG")
-        print(f"\n{Fore.CYAN}🎤 Manual Mode - Press 's' + Enter to record, 't' + Enter to stop{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}💡 Controls: 's' + Enter = start, 't' + Enter = stop, 'q' + Enter = quit, 'h' + Enter = help{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}🤖 Dialog Integration: Intelligent responses with language detection and context awareness{Style.RESET_ALL}")
+        sys.stdout.write(_MANUAL_INTRO)
         
+        # Set running to True for manual mode
+        self.running = True
+        
+        # Audio is captured on a background thread so input() stays responsive
+        stop_reading = threading.Event()
+        reader_thread = None
+        
+        self._in_input_loop = True
         try:
             from voice_bot.audio_utils import AudioRecorder, AudioTranscriber
             
@@ -372,7 +908,7 @@ class VoiceBotCLI:
                 print(f"{Fore.YELLOW}⏳ Initializing dialog system for manual mode...{Style.RESET_ALL}")
                 try:
                     from voice_bot.voice_bot import VoiceBot
-                    self.voice_bot = VoiceBot(models_dir=getattr(self, 'models_dir', 'models'))
+                    self.voice_bot = VoiceBot(models_dir=self.models_dir)
                     print(f"{Fore.GREEN}✅ Dialog system ready{Style.RESET_ALL}")
                 except Exception as e:
                     print(f"{Fore.YELLOW}⚠️  Dialog system initialization failed: {e}{Style.RESET_ALL}")
@@ -381,59 +917,69 @@ class VoiceBotCLI:
             
             # Initialize audio recorder and transcriber
             recorder = AudioRecorder()
-            transcriber = AudioTranscriber(models_dir=getattr(self, 'models_dir', 'models'))
+            transcriber = AudioTranscriber(models_dir=self.models_dir)
             
             is_recording = False
-            recording_data = []
+            # Chunks of the current recording, with a running byte count
+            recording_data = []  # Handed to the transcriber unjoined
+            recorded_bytes = 0
+            
+            def read_audio():
+                """Append microphone chunks to recording_data until stop_reading is set"""
+                nonlocal recorded_bytes
+                while not stop_reading.is_set():
+                    try:
+                        data = recorder.stream.read(recorder.chunk_size, exception_on_overflow=False)
+                    except Exception as e:
+                        debug_log(f"Audio read failed: {e}", "ERROR")
+                        break
+                    recording_data.append(data)
+                    recorded_bytes += len(data)
             
-            print(f"{Fore.GREEN}🎤 Manual recording ready{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}💡 Type 's' + Enter to start recording{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}💡 Type 't' + Enter to stop recording{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}💡 Type 'q' + Enter to quit{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}💡 Type 'h' + Enter for help{Style.RESET_ALL}")
+            sys.stdout.write(_MANUAL_READY)
             
             while self.running:
                 try:
-                    command = input(f"\n{Fore.CYAN}Voice Bot> {Style.RESET_ALL}").strip().lower()
+                    command = input(self._manual_prompt).strip().lower()
                     
-                    if command in ['s', 'start']:
+                    if command in _CMD_START:
                         if not is_recording:
                             is_recording = True
-                            recording_data = []
+                            recording_data.clear()
+                            recorded_bytes = 0
                             print(f"\n{Fore.GREEN}🔴 RECORDING STARTED{Style.RESET_ALL}")
                             print(f"{Fore.WHITE}💡 Type 't' + Enter to stop recording{Style.RESET_ALL}")
                             
                             # Start recording
                             recorder.start_recording()
-                            while is_recording:
-                                try:
-                                    data = recorder.stream.read(recorder.chunk_size, exception_on_overflow=False)
-                                    recording_data.append(data)
-                                except:
-                                    break
+                            stop_reading.clear()
+                            reader_thread = threading.Thread(target=read_audio, name="manual-recorder", daemon=True)
+                            reader_thread.start()
                         else:
                             print(f"{Fore.YELLOW}⚠️  Already recording{Style.RESET_ALL}")
                             
-                    elif command in ['t', 'stop']:
+                    elif command in _CMD_STOP:
                         if is_recording:
                             is_recording = False
+                            # Let the reader finish its current chunk before closing the stream
+                            stop_reading.set()
+                            reader_thread.join()
+                            reader_thread = None
                             recorder.stop_recording()
                             
                             print(f"\n{Fore.YELLOW}⏹️  RECORDING STOPPED{Style.RESET_ALL}")
                             
                             # Calculate duration
-                            if recording_data:
-                                total_bytes = len(b''.join(recording_data))
-                                duration = total_bytes / (2 * 16000)  # 16-bit, 16kHz
+                            if recorded_bytes:
+                                duration = recorded_bytes / (2 * 16000)  # 16-bit, 16kHz
                                 print(f"{Fore.CYAN}📊 Recording stats:{Style.RESET_ALL}")
                                 print(f"  • Duration: {duration:.1f} seconds")
                                 print(f"  • Audio chunks: {len(recording_data)}")
-                                print(f"  • Total size: {total_bytes} bytes")
+                                print(f"  • Total size: {recorded_bytes} bytes")
                                 
                                 # Transcribe audio
                                 print(f"{Fore.CYAN}🔄 Processing recording for transcription...{Style.RESET_ALL}")
-                                audio_data = b''.join(recording_data)
-                                transcript = transcriber.transcribe_audio(audio_data)
+                                transcript = transcriber.transcribe_chunks(recording_data)
                                 
                                 if transcript and transcript != "No speech detected":
                                     print(f"\n{Fore.MAGENTA}📝 Transcript:{Style.RESET_ALL}")
@@ -447,7 +993,7 @@ class VoiceBotCLI:
                                             # Detect language first
                                             print(f"{Fore.BLUE}🌐 Detecting language...{Style.RESET_ALL}")
                                             debug_log("Starting language detection", "DEBUG")
-                                            detected_language, confidence = self.voice_bot.language_detector.detect_language(transcript)
+                                            detected_language, confidence = self._detect_language(transcript)
                                             print(f"{Fore.BLUE}🌐 Language detected: {detected_language} (confidence: {confidence:.2f}){Style.RESET_ALL}")
                                             debug_log(f"Language detected: {detected_language} (confidence: {confidence:.2f})", "DEBUG")
                                             
@@ -458,15 +1004,8 @@ class VoiceBotCLI:
                                             debug_log(f"Dialog response generated: '{response}'", "DEBUG")
                                             
                                             # Update conversation context
-                                            self.conversation_context.append({
-                                                'turn': len(self.conversation_context) + 1,
-                                                'input': transcript,
-                                                'response': response,
-                                                'language': detected_language,
-                                                'confidence': confidence,
-                                                'timestamp': time.time()
-                                            })
-                                            debug_log(f"Conversation context updated: {len(self.conversation_context)} turns", "DEBUG")
+                                            self.add_turn(transcript, response, detected_language, confidence)
+                                            debug_log(f"Conversation context updated: {len(self._ctx_inputs)} turns", "DEBUG")
                                             
                                             # Update conversation state
                                             self.conversation_state = "active"
@@ -482,8 +1021,7 @@ class VoiceBotCLI:
                                             print(f"{Fore.YELLOW}⚠️  Voice bot not available, using fallback{Style.RESET_ALL}")
                                             debug_log("Voice bot not available, using fallback", "WARNING")
                                             print(f"{Fore.WHITE}🔊 Speaking transcript...{Style.RESET_ALL}")
-                                            import subprocess
-                                            subprocess.run(["say", f"I heard you say: {transcript}"], check=True)
+                                            self._say(f"I heard you say: {transcript}")
                                     except Exception as e:
                                         print(f"{Fore.RED}❌ Dialog system error: {e}{Style.RESET_ALL}")
                                         debug_log(f"Dialog system error: {e}", "ERROR")
@@ -494,59 +1032,47 @@ class VoiceBotCLI:
                                         if self.voice_bot:
                                             self.voice_bot.speak(fallback_response)
                                         else:
-                                            import subprocess
-                                            subprocess.run(["say", fallback_response], check=True)
+                                            self._say(fallback_response)
                                 else:
                                     print(f"{Fore.YELLOW}⚠️  No speech detected{Style.RESET_ALL}")
                                     if self.voice_bot:
                                         self.voice_bot.speak("I couldn't understand what you said.")
                                     else:
-                                        import subprocess
-                                        subprocess.run(["say", "I couldn't understand what you said."], check=True)
+                                        self._say("I couldn't understand what you said.")
                                 
                                 print(f"\n{Fore.GREEN}✅ Transcription completed{Style.RESET_ALL}")
                                 print(f"{Fore.WHITE}💡 Type 's' + Enter to start new recording{Style.RESET_ALL}")
                                 
                                 # Clear recording data
-                                recording_data = []
+                                recording_data.clear()
+                                recorded_bytes = 0
                         else:
                             print(f"{Fore.YELLOW}⚠️  Not currently recording{Style.RESET_ALL}")
                             
-                    elif command in ['q', 'quit', 'exit']:
+                    elif command in _CMD_QUIT:
                         print(f"{Fore.YELLOW}👋 Exiting manual mode...{Style.RESET_ALL}")
                         break
                         
-                    elif command in ['h', 'help']:
-                        print(f"{Fore.CYAN}Commands (type + Enter):{Style.RESET_ALL}")
-                        print(f"  {Fore.WHITE}s / start{Style.RESET_ALL} - Begin recording")
-                        print(f"  {Fore.WHITE}t / stop{Style.RESET_ALL}  - Stop recording and process through dialog system")
-                        print(f"  {Fore.WHITE}q / quit{Style.RESET_ALL}  - Exit the bot")
-                        print(f"  {Fore.WHITE}h / help{Style.RESET_ALL}  - Show this help")
-                        print(f"  {Fore.WHITE}c / context{Style.RESET_ALL} - Show conversation history")
-                        print(f"  {Fore.WHITE}clear{Style.RESET_ALL} - Clear conversation history")
-                        print(f"\n{Fore.YELLOW}💡 Dialog Integration:{Style.RESET_ALL}")
-                        print(f"  {Fore.GREEN}✅ Intelligent responses{Style.RESET_ALL} - Uses dialog system instead of echo")
-                        print(f"  {Fore.GREEN}✅ Language detection{Style.RESET_ALL} - Automatically detects English/Hindi")
-                        print(f"  {Fore.GREEN}✅ Context awareness{Style.RESET_ALL} - Maintains conversation context")
-                        print(f"  {Fore.GREEN}✅ Error handling{Style.RESET_ALL} - Graceful fallback responses")
-                        print(f"\n{Fore.YELLOW}💡 Remember: Type the command and press Enter!{Style.RESET_ALL}")
+                    elif command in _CMD_HELP:
+                        sys.stdout.write(_MANUAL_HELP)
                         
-                    elif command in ['c', 'context']:
+                    elif command in _CMD_CONTEXT:
                         print(f"\n{Fore.CYAN}📚 Conversation History:{Style.RESET_ALL}")
-                        if self.conversation_context:
-                            for i, turn in enumerate(self.conversation_context):
-                                print(f"\n{Fore.YELLOW}Turn {turn['turn']}:{Style.RESET_ALL}")
-                                print(f"  {Fore.WHITE}Input:{Style.RESET_ALL} '{turn['input']}'")
-                                print(f"  {Fore.WHITE}Response:{Style.RESET_ALL} '{turn['response']}'")
-                                print(f"  {Fore.WHITE}Language:{Style.RESET_ALL} {turn['language']} (confidence: {turn['confidence']:.2f})")
-                                print(f"  {Fore.WHITE}Time:{Style.RESET_ALL} {time.strftime('%H:%M:%S', time.localtime(turn['timestamp']))}")
+                        if self._ctx_inputs:
+                            turns = zip(self._ctx_inputs, self._ctx_responses, self._ctx_langs,
+                                        self._ctx_conf, self._ctx_ts)
+                            for i, (text, response, language, confidence, timestamp) in enumerate(turns, 1):
+                                print(f"\n{Fore.YELLOW}Turn {i}:{Style.RESET_ALL}")
+                                print(f"  {Fore.WHITE}Input:{Style.RESET_ALL} '{text}'")
+                                print(f"  {Fore.WHITE}Response:{Style.RESET_ALL} '{response}'")
+                                print(f"  {Fore.WHITE}Language:{Style.RESET_ALL} {language} (confidence: {confidence:.2f})")
+                                print(f"  {Fore.WHITE}Time:{Style.RESET_ALL} {time.strftime('%H:%M:%S', time.localtime(timestamp))}")
                         else:
                             print(f"  {Fore.YELLOW}No conversation history yet{Style.RESET_ALL}")
-                        print(f"\n{Fore.CYAN}Total turns: {len(self.conversation_context)}{Style.RESET_ALL}")
+                        print(f"\n{Fore.CYAN}Total turns: {len(self._ctx_inputs)}{Style.RESET_ALL}")
                         
                     elif command == 'clear':
-                        self.conversation_context = []
-                        self.conversation_state = "idle"
+                        self._clear_context()
                         print(f"{Fore.GREEN}✅ Conversation history cleared{Style.RESET_ALL}")
                         debug_log("Conversation context cleared", "DEBUG")
                         
@@ -570,28 +1096,32 @@ class VoiceBotCLI:
             traceback.print_exc()
         finally:
             # Cleanup
+            self._in_input_loop = False
+            stop_reading.set()
+            if reader_thread is not None:
+                reader_thread.join()
             try:
                 if 'recorder' in locals():
                     recorder.stop_recording()
             except:
                 pass
+            flush_debug_log()
     
     def _on_speech_detected(self, text: str):
         """Callback for detected speech"""
-        print(f"\n{Fore.GREEN}👤 You: {text}{Style.RESET_ALL}")
+        write_stdout_bytes(_USER_PREFIX + text.encode() + _LINE_SUFFIX)
     
     def _on_response_generated(self, response: str):
         """Callback for generated response"""
-        print(f"{Fore.BLUE}🤖 Bot: {response}{Style.RESET_ALL}")
+        write_stdout_bytes(_BOT_PREFIX + response.encode() + _LINE_SUFFIX)
     
     def _on_language_detected(self, language: str):
         """Callback for language detection"""
-        lang_name = "English" if language == "en" else "Hindi"
-        print(f"{Fore.MAGENTA}🌐 Language: {lang_name}{Style.RESET_ALL}")
+        write_stdout_bytes(_LANGUAGE_LINES["en" if language == "en" else "hi"])
     
     def _on_error(self, error: Exception):
         """Callback for errors"""
-        print(f"{Fore.RED}❌ Error: {error}{Style.RESET_ALL}")
+        write_stdout_bytes(_ERROR_PREFIX + str(error).encode() + _LINE_SUFFIX)
     
     def _print_history(self, history: list):
         """Print conversation history"""
@@ -599,16 +1129,99 @@ class VoiceBotCLI:
             print(f"{Fore.YELLOW}No conversation history{Style.RESET_ALL}")
             return
         
-        print(f"\n{Fore.CYAN}📜 Conversation History:{Style.RESET_ALL}")
+        # Build the whole listing and emit it in one write
+        parts = [f"\n{Fore.CYAN}📜 Conversation History:{Style.RESET_ALL}\n"]
         for i, exchange in enumerate(history[-10:], 1):  # Show last 10 exchanges
-            print(f"\n{Fore.BLUE}{i}. {exchange['timestamp']}{Style.RESET_ALL}")
-            print(f"   {Fore.GREEN}👤 You: {exchange['user_input']}{Style.RESET_ALL}")
-            print(f"   {Fore.BLUE}🤖 Bot: {exchange['bot_response']}{Style.RESET_ALL}")
-            print(f"   {Fore.MAGENTA}🎯 Intent: {exchange['intent']}{Style.RESET_ALL}")
+            parts.append(
+                f"\n{Fore.BLUE}{i}. {exchange['timestamp']}{Style.RESET_ALL}\n"
+                f"   {Fore.GREEN}👤 You: {exchange['user_input']}{Style.RESET_ALL}\n"
+                f"   {Fore.BLUE}🤖 Bot: {exchange['bot_response']}{Style.RESET_ALL}\n"
+                f"   {Fore.MAGENTA}🎯 Intent: {exchange['intent']}{Style.RESET_ALL}\n"
+            )
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
 
-def main():
-    """Main entry point"""
+# Defaults and value types for the command line flags; _fast_parse handles
+# these directly and _build_parser mirrors them for argparse
+_DEFAULTS = {
+    'models_dir': 'models',
+    'vosk_en_model': None,
+    'vosk_hi_model': None,
+    'tts_language': 'en',
+    'use_gpu': False,
+    'sample_rate': 16000,
+    'chunk_size': 1024,
+    'mode': 'voice',
+    'verbose': False,
+}
+
+_VALUE_FLAGS = {
+    '--models-dir': ('models_dir', str, None),
+    '--vosk-en-model': ('vosk_en_model', str, None),
+    '--vosk-hi-model': ('vosk_hi_model', str, None),
+    '--tts-language': ('tts_language', str, ('en', 'hi')),
+    '--sample-rate': ('sample_rate', int, None),
+    '--chunk-size': ('chunk_size', int, None),
+    '--mode': ('mode', str, ('voice', 'interactive', 'manual')),
+}
+
+_SWITCH_FLAGS = {
+    '--use-gpu': 'use_gpu',
+    '--verbose': 'verbose',
+    '-v': 'verbose',
+}
+
+
+def _fast_parse(argv: list) -> Optional[types.SimpleNamespace]:
+    """
+    Parse the well-known flags without argparse
+    
+    Args:
+        argv: Command line arguments (without the program name)
+        
+    Returns:
+        Parsed arguments, or None if argv needs the full argparse parser
+        (help, unknown flags, invalid values or values that look like flags)
+    """
+    values = dict(_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        
+        if arg in _SWITCH_FLAGS:
+            values[_SWITCH_FLAGS[arg]] = True
+            continue
+        
+        flag, sep, value = arg.partition('=')
+        spec = _VALUE_FLAGS.get(flag)
+        if spec is None:
+            return None
+        if not sep:
+            # argparse decides whether e.g. "--models-dir -h" is a value or a flag
+            if i >= len(argv) or argv[i].startswith('-'):
+                return None
+            value = argv[i]
+            i += 1
+        
+        dest, kind, choices = spec
+        if kind is int:
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        if choices and value not in choices:
+            return None
+        values[dest] = value
+    
+    return types.SimpleNamespace(**values)
+
+
+def _build_parser():
+    """Build the full argparse parser (used for --help and error reporting)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Voice Bot - Multilingual Voice Assistant with Keyboard-Controlled Dialog Integration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -664,10 +1277,19 @@ Dialog Integration Features:
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point"""
+    argv = sys.argv[1:]
+    args = _fast_parse(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
     
     # Create CLI instance
     cli = VoiceBotCLI()
+    cli.install_signal_handlers()
     
     # Setup logging
     cli.setup_logging(args.verbose)
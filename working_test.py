@@ -5,16 +5,35 @@ Actually works without hanging - tests core functionality only
 """
 
 import sys
+import functools
+import importlib
 from pathlib import Path
-from colorama import Fore, Style, init
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-init(autoreset=True)
+@functools.lru_cache(maxsize=1)
+def _colors():
+    """Import and initialize colorama on first use (not at import time)"""
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+    return Fore, Style
+
+@functools.lru_cache(maxsize=1)
+def _components():
+    """Build the language detector and dialog manager once per process"""
+    from voice_bot.language_detection import LanguageDetector
+    from voice_bot.dialog_system import DialogManager
+    return LanguageDetector(), DialogManager()
+
+@functools.lru_cache(maxsize=64)
+def _cached_detect(text):
+    """Language detection probe, memoized for repeated runs"""
+    return _components()[0].detect_language(text)
 
 def working_test():
     """Test that actually works without hanging"""
+    Fore, Style = _colors()
     print(f"{Fore.CYAN}🧪 Working Voice Bot Test{Style.RESET_ALL}")
     print(f"{Fore.CYAN}========================{Style.RESET_ALL}")
     
@@ -25,11 +44,11 @@ def working_test():
     try:
         # Test individual lightweight components
         print(f"{Fore.CYAN}Testing language detection import...{Style.RESET_ALL}")
-        from voice_bot.language_detection import LanguageDetector
+        importlib.import_module("voice_bot.language_detection")
         print(f"{Fore.GREEN}✅ Language detection imported successfully{Style.RESET_ALL}")
         
         print(f"{Fore.CYAN}Testing dialog system import...{Style.RESET_ALL}")
-        from voice_bot.dialog_system import DialogManager
+        importlib.import_module("voice_bot.dialog_system")
         print(f"{Fore.GREEN}✅ Dialog system imported successfully{Style.RESET_ALL}")
         
     except Exception as e:
@@ -39,8 +58,7 @@ def working_test():
     # Test 2: Initialize components
     print(f"\n{Fore.YELLOW}2. Testing component initialization...{Style.RESET_ALL}")
     try:
-        detector = LanguageDetector()
-        dialog = DialogManager()
+        _components()
         print(f"{Fore.GREEN}✅ Components initialized successfully{Style.RESET_ALL}")
         
     except Exception as e:
@@ -51,11 +69,11 @@ def working_test():
     print(f"\n{Fore.YELLOW}3. Testing basic functionality...{Style.RESET_ALL}")
     try:
         # Test language detection
-        lang, conf = detector.detect_language("Hello")
+        lang, conf = _cached_detect("Hello")
         print(f"{Fore.GREEN}✅ Language detection: {lang} (confidence: {conf:.2f}){Style.RESET_ALL}")
         
         # Test dialog system
-        response = dialog.process_input("Hello", "en")
+        response = _components()[1].process_input("Hello", "en")
         print(f"{Fore.GREEN}✅ Dialog response: '{response[:50]}...'{Style.RESET_ALL}")
         
     except Exception as e:
@@ -79,6 +97,7 @@ def working_test():
 
 if __name__ == "__main__":
     success = working_test()
+    Fore, Style = _colors()
     if success:
         print(f"\n{Fore.CYAN}🚀 Ready to test full voice bot?{Style.RESET_ALL}")
         print(f"Run: {Fore.YELLOW}python voice_bot_cli.py --mode interactive{Style.RESET_ALL}")